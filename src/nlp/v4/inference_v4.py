@@ -18,6 +18,8 @@ Fixes:
 import re
 import json
 import torch
+import torch.nn.functional as F
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from transformers import (
     AutoTokenizer,
@@ -25,6 +27,73 @@ from transformers import (
     AutoModelForTokenClassification
 )
 
+# INT8 inference with ONNX Runtime (optional, see quantize_onnx.py)
+try:
+    from optimum.onnxruntime import (
+        ORTModelForSequenceClassification,
+        ORTModelForTokenClassification
+    )
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+PRECISIONS = ("fp32", "int8", "fp16", "bf16")
+
+# Half-precision weights run on the GPU (tensor cores); bf16 needs Ampere or newer
+HALF_PRECISION_DTYPES = {
+    "fp16": torch.float16,
+    "bf16": torch.bfloat16,
+}
+
+# File name written by ORTQuantizer
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+
+
+def quantized_model_path(model_path: str) -> str:
+    """INT8 ONNX export directory for a model (next to its `final` directory)"""
+    return str(Path(model_path).parent / "onnx_int8")
+
+
+def load_model(model_path: str, task: str, precision: str = "fp32"):
+    """
+    Load a sequence/token classification model at the given precision
+    
+    Args:
+        model_path: HF model directory (e.g. models/v4_production/ner/final)
+        task: "sequence" or "token" classification
+        precision: "fp32" (PyTorch), "int8" (quantized ONNX Runtime model),
+            or "fp16"/"bf16" (PyTorch half-precision weights on CUDA)
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision: {precision} (expected one of {PRECISIONS})")
+    
+    if precision == "int8":
+        if not ONNXRUNTIME_AVAILABLE:
+            raise ImportError("INT8 inference needs ONNX Runtime. Install with: pip install optimum[onnxruntime]")
+        ort_class = ORTModelForSequenceClassification if task == "sequence" else ORTModelForTokenClassification
+        return ort_class.from_pretrained(
+            quantized_model_path(model_path),
+            file_name=QUANTIZED_MODEL_FILE,
+            provider="CPUExecutionProvider"
+        )
+    
+    auto_class = AutoModelForSequenceClassification if task == "sequence" else AutoModelForTokenClassification
+    
+    if precision in HALF_PRECISION_DTYPES:
+        if not torch.cuda.is_available():
+            raise RuntimeError(f"{precision} inference needs a CUDA GPU (use fp32 or int8 on CPU)")
+        if precision == "bf16" and not torch.cuda.is_bf16_supported():
+            raise RuntimeError("This GPU does not support bf16, use fp16")
+        model = auto_class.from_pretrained(model_path, torch_dtype=HALF_PRECISION_DTYPES[precision])
+        return model.to("cuda").eval()
+    
+    return auto_class.from_pretrained(model_path)
+
+
+def model_device(precision: str) -> torch.device:
+    """Device the inputs must be on for a model loaded by `load_model`"""
+    return torch.device("cuda" if precision in HALF_PRECISION_DTYPES else "cpu")
+
 
 def correct_ocr_errors(text: str) -> str:
     """
@@ -112,9 +181,10 @@ class RobustIntentClassifier:
     v4 Intent Classifier with OCR correction
     """
     
-    def __init__(self, model_path: str = "models/v4_production/intent_classifier/final"):
+    def __init__(self, model_path: str = "models/v4_production/intent_classifier/final", precision: str = "fp32"):
         self.tokenizer = AutoTokenizer.from_pretrained(model_path)
-        self.model = AutoModelForSequenceClassification.from_pretrained(model_path)
+        self.model = load_model(model_path, "sequence", precision)
+        self.device = model_device(precision)
         
         self.id_to_label = {
             0: "kira_odemesi",
@@ -185,23 +255,42 @@ class RobustIntentClassifier:
                 'is_multi_intent': bool
             }
         """
-        # Preprocess
-        text_processed = self.preprocess(text)
-        
-        # Tokenize
-        inputs = self.tokenizer(
-            text_processed,
-            return_tensors="pt",
-            truncation=True,
-            padding=True,
-            max_length=128
-        )
+        return self.predict_batch([text], multi_intent=multi_intent)[0]
+    
+    def predict_batch(self, texts: List[str], multi_intent: bool = True, batch_size: int = 32) -> List[Dict]:
+        """
+        Intent classification for many texts, one forward pass per batch
+        
+        Returns:
+            List of `predict` results, in input order
+        """
+        texts_processed = [self.preprocess(text) for text in texts]
+        results = []
         
-        # Predict
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            probs = torch.softmax(outputs.logits, dim=-1)[0]
+        for start in range(0, len(texts_processed), batch_size):
+            chunk = texts_processed[start:start + batch_size]
+            
+            # Tokenize (padded to the longest text in the batch)
+            inputs = self.tokenizer(
+                chunk,
+                return_tensors="pt",
+                truncation=True,
+                padding=True,
+                max_length=128
+            ).to(self.device)
+            
+            # Predict (probabilities in fp32 on CPU, whatever the model precision)
+            with torch.inference_mode():
+                outputs = self.model(**inputs)
+                probs_batch = torch.softmax(outputs.logits.float(), dim=-1).cpu()
+            
+            for text_processed, probs in zip(chunk, probs_batch):
+                results.append(self._postprocess(text_processed, probs, multi_intent))
         
+        return results
+    
+    def _postprocess(self, text_processed: str, probs: torch.Tensor, multi_intent: bool) -> Dict:
+        """Keyword/context boosting and multi-intent detection for one text"""
         # Primary intent
         predicted_class = torch.argmax(probs).item()
         primary_intent = self.id_to_label[predicted_class]
@@ -315,9 +404,10 @@ class RobustNERExtractor:
     - Multi-period support
     """
     
-    def __init__(self, model_path: str = "models/v4_production/ner/final"):
+    def __init__(self, model_path: str = "models/v4_production/ner/final", precision: str = "fp32"):
         self.tokenizer = AutoTokenizer.from_pretrained(model_path)
-        self.model = AutoModelForTokenClassification.from_pretrained(model_path)
+        self.model = load_model(model_path, "token", precision)
+        self.device = model_device(precision)
         
         # v4 Label mapping (11 entities: FEE removed, TITLE added)
         self.id2label = {
@@ -378,27 +468,48 @@ class RobustNERExtractor:
         
         Returns: {entity_type: [(value, confidence), ...]}
         """
-        import torch.nn.functional as F
+        return self.extract_bert_batch([text])[0]
+    
+    def extract_bert_batch(self, texts: List[str], batch_size: int = 32) -> List[Dict[str, List[tuple]]]:
+        """
+        BERT entity extraction for many texts, one forward pass per batch
         
+        Returns: List of `extract_bert` results, in input order
+        """
         # Preprocess
-        text = self.preprocess(text)
-        text_lower = text.lower()
-        
-        inputs = self.tokenizer(
-            text_lower,
-            return_tensors="pt",
-            truncation=True,
-            max_length=256
-        )
+        texts_lower = [self.preprocess(text).lower() for text in texts]
+        results = []
         
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            # Get probabilities (confidence scores)
-            probabilities = F.softmax(outputs.logits, dim=-1)[0]
-            predictions = torch.argmax(outputs.logits, dim=-1)[0]
-        
-        tokens = self.tokenizer.convert_ids_to_tokens(inputs['input_ids'][0])
+        for start in range(0, len(texts_lower), batch_size):
+            chunk = texts_lower[start:start + batch_size]
+            
+            # Padded to the longest text; [PAD] tokens are skipped when decoding
+            inputs = self.tokenizer(
+                chunk,
+                return_tensors="pt",
+                truncation=True,
+                padding=True,
+                max_length=256
+            ).to(self.device)
+            
+            with torch.inference_mode():
+                outputs = self.model(**inputs)
+                # Get probabilities (confidence scores) in fp32 on CPU, so
+                # decoding does not sync with the GPU once per token
+                logits = outputs.logits.float().cpu()
+                probabilities_batch = F.softmax(logits, dim=-1)
+                predictions_batch = torch.argmax(logits, dim=-1)
+            
+            for row, input_ids in enumerate(inputs['input_ids'].cpu()):
+                tokens = self.tokenizer.convert_ids_to_tokens(input_ids)
+                results.append(
+                    self._decode_entities(tokens, probabilities_batch[row], predictions_batch[row])
+                )
         
+        return results
+    
+    def _decode_entities(self, tokens: List[str], probabilities: torch.Tensor, predictions: torch.Tensor) -> Dict[str, List[tuple]]:
+        """Merge BIO-tagged subword tokens into (value, confidence) entities"""
         entities = {}
         current_entity = None
         current_tokens = []
@@ -546,9 +657,23 @@ class RobustNERExtractor:
                 'confidence_scores': Dict
             }
         """
-        # BERT extraction (with confidence)
-        entities_bert_raw = self.extract_bert(text)
+        return self._merge(text, self.extract_bert(text), use_fallback)
+    
+    def extract_batch(self, texts: List[str], use_fallback: bool = True, batch_size: int = 32) -> List[Dict]:
+        """
+        Hybrid extraction for many texts (BERT runs batched)
         
+        Returns:
+            List of `extract` results, in input order
+        """
+        entities_bert_batch = self.extract_bert_batch(texts, batch_size=batch_size)
+        return [
+            self._merge(text, entities_bert_raw, use_fallback)
+            for text, entities_bert_raw in zip(texts, entities_bert_batch)
+        ]
+    
+    def _merge(self, text: str, entities_bert_raw: Dict[str, List[tuple]], use_fallback: bool) -> Dict:
+        """Combine BERT entities with regex fallback using confidence-based selection"""
         # Convert BERT format: {type: [(value, conf), ...]} -> {type: (value, conf)}
         entities_bert = {}
         for entity_type, values in entities_bert_raw.items():
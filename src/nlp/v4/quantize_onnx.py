@@ -0,0 +1,84 @@
+"""
+INT8 ONNX Export - v4 Intent + NER Models
+==========================================
+
+Exports the trained v4 models to ONNX and applies dynamic INT8
+quantization (AVX-512 VNNI) with ONNX Runtime. The quantized models are
+written next to each `final` directory as `onnx_int8/` and loaded by
+`RobustIntentClassifier(precision="int8")` / `RobustNERExtractor(precision="int8")`.
+
+Usage:
+    pip install optimum[onnxruntime]
+    python src/nlp/v4/quantize_onnx.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.nlp.v4.inference_v4 import quantized_model_path
+
+
+DEFAULT_MODELS = {
+    "sequence": "models/v4_production/intent_classifier/final",
+    "token": "models/v4_production/ner/final",
+}
+
+
+def quantize_model(model_path: str, task: str) -> str:
+    """
+    Export one model to ONNX and quantize it to INT8
+
+    Args:
+        model_path: HF model directory
+        task: "sequence" or "token" classification
+
+    Returns:
+        Directory containing the quantized model
+    """
+    from optimum.onnxruntime import (
+        ORTModelForSequenceClassification,
+        ORTModelForTokenClassification,
+        ORTQuantizer
+    )
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    ort_class = ORTModelForSequenceClassification if task == "sequence" else ORTModelForTokenClassification
+    save_dir = quantized_model_path(model_path)
+
+    print(f"📦 Exporting {model_path} to ONNX...")
+    model = ort_class.from_pretrained(model_path, export=True)
+
+    print(f"⚙️  Quantizing to INT8 (dynamic, AVX-512 VNNI)...")
+    quantizer = ORTQuantizer.from_pretrained(model)
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+
+    print(f"✅ Saved to: {save_dir}")
+    return save_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export v4 models to INT8 ONNX')
+    parser.add_argument(
+        '--intent-model',
+        type=str,
+        default=DEFAULT_MODELS["sequence"],
+        help=f'Intent classifier directory (default: {DEFAULT_MODELS["sequence"]})'
+    )
+    parser.add_argument(
+        '--ner-model',
+        type=str,
+        default=DEFAULT_MODELS["token"],
+        help=f'NER model directory (default: {DEFAULT_MODELS["token"]})'
+    )
+    args = parser.parse_args()
+
+    quantize_model(args.intent_model, "sequence")
+    quantize_model(args.ner_model, "token")
+
+
+if __name__ == "__main__":
+    main()
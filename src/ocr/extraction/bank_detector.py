@@ -18,6 +18,13 @@ except ImportError:
     LOGO_DETECTION_AVAILABLE = False
     detect_bank_from_logos = None
 
+# Tüm keywords'ü tek geçişte aramak için Aho-Corasick (opsiyonel bağımlılık)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 # Her banka için karakteristik keywords ve banka isimleri
 BANK_KEYWORDS: Dict[str, List[str]] = {
@@ -76,34 +83,67 @@ BANK_KEYWORDS: Dict[str, List[str]] = {
 }
 
 
-def detect_bank(text: str) -> Optional[str]:
+def _build_keyword_automaton():
+    """Tüm bankaların keywords'ü için Aho-Corasick otomatı oluşturur."""
+    automaton = ahocorasick.Automaton()
+    for keywords in BANK_KEYWORDS.values():
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            automaton.add_word(keyword_lower, keyword_lower)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _bank_scores(text_lower: str) -> Dict[str, int]:
     """
-    PDF metninden bankayı otomatik olarak tespit eder.
+    Metinde geçen keywords'e göre banka skorlarını hesaplar.
 
-    Parametreler:
-        text: PDF'den çıkarılan ham metin.
+    Her keyword metinde geçiyorsa uzunluğu kadar puan verir (uzun keywords
+    daha yüksek öncelikli). Aho-Corasick kuruluysa metin bir kez taranır;
+    çakışan eşleşmeler de raporlandığından sonuç `in` kontrolüyle aynıdır.
 
     Dönen:
-        Tespit edilen banka adı (ör. "halkbank", "yapikredi") veya None.
+        Banka adı -> skor; BANK_KEYWORDS sırasıyla, yalnızca skoru 0'dan
+        büyük bankalar.
     """
-    if not text:
-        return None
-
-    text_lower = text.lower()
+    if _KEYWORD_AUTOMATON is not None:
+        found = {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text_lower)}
+    else:
+        found = None
 
-    # Her banka için eşleşme skorunu hesapla
     bank_scores: Dict[str, int] = {}
-
     for bank_name, keywords in BANK_KEYWORDS.items():
         score = 0
         for keyword in keywords:
-            if keyword.lower() in text_lower:
-                # Uzun keywords daha yüksek öncelikli
+            keyword_lower = keyword.lower()
+            if (keyword_lower in found) if found is not None else (keyword_lower in text_lower):
                 score += len(keyword)
 
         if score > 0:
             bank_scores[bank_name] = score
 
+    return bank_scores
+
+
+def detect_bank(text: str) -> Optional[str]:
+    """
+    PDF metninden bankayı otomatik olarak tespit eder.
+
+    Parametreler:
+        text: PDF'den çıkarılan ham metin.
+
+    Dönen:
+        Tespit edilen banka adı (ör. "halkbank", "yapikredi") veya None.
+    """
+    if not text:
+        return None
+
+    # Her banka için eşleşme skorunu hesapla
+    bank_scores = _bank_scores(text.lower())
+
     if not bank_scores:
         return None
 
@@ -126,19 +166,7 @@ def detect_bank_with_confidence(text: str) -> Tuple[Optional[str], float]:
     if not text:
         return None, 0.0
 
-    text_lower = text.lower()
-    bank_scores: Dict[str, int] = {}
-
-    for bank_name, keywords in BANK_KEYWORDS.items():
-        score = 0
-        matches = 0
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                score += len(keyword)
-                matches += 1
-
-        if score > 0:
-            bank_scores[bank_name] = score
+    bank_scores = _bank_scores(text.lower())
 
     if not bank_scores:
         return None, 0.0
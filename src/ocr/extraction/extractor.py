@@ -7,19 +7,37 @@ kiracı/ödeme bilgilerini yakalamaya odaklanır.
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Dict, Mapping, MutableMapping, Optional, Tuple
+import re
+from typing import Dict, Mapping, Match, MutableMapping, Optional, Pattern, Tuple
 
 from .regex_patterns import (
     BANK_SPECIFIC_PATTERNS,
     GENERIC_AMOUNT_FALLBACK,
     GENERIC_PATTERNS,
     ReceiptPatterns,
+    find_iban_start,
+    fold_for_anchors,
 )
 
 
 FieldMap = Dict[str, str]
 
+# İsimlerde harflerle çevrili OCR rakamları (1BRAH1M -> IBRAHIM, 0SMAN -> OSMAN)
+_NAME_ONE_RE = re.compile(r'([A-ZÇĞİÖŞÜa-zçğıöşü])1([A-ZÇĞİÖŞÜa-zçğıöşü])')
+_NAME_ZERO_RE = re.compile(r'([A-ZÇĞİÖŞÜa-zçğıöşü])0([A-ZÇĞİÖŞÜa-zçğıöşü])')
+
+# Açıklamadan silinecek ekler (sırayla uygulanır)
+_DESCRIPTION_STRIP_RES = (
+    # VALÖR tarihi
+    re.compile(r'VALÖR\s*[:\-]?\s*\d{2}\.\d{2}\.\d{4}\s*', re.IGNORECASE),
+    # İŞLEM YERİ + banka adı
+    re.compile(r'İŞLEM\s+YERİ\s*[:\-]?\s*[A-ZÇĞİÖŞÜ\s]+', re.IGNORECASE),
+    # Banka mobil uygulamaları
+    re.compile(r'(ZİRAAT|HALKBANK|KUVEYT\s+TÜRK|YAPI\s+KREDİ)\s+MOBİL\s*', re.IGNORECASE),
+    # Başta kalan iki nokta, tire, boşluklar
+    re.compile(r'^[:\-\s]+'),
+)
+
 
 def clean_field_value(value: Optional[str]) -> str:
     """Regex yakalamalarında dönen alanları sadeleştir."""
@@ -110,28 +128,72 @@ def normalize_name_ocr(name: str) -> str:
     normalized = normalized.replace(" 1", " I")
     
     # Harflerle çevrili 1'leri I yap (örn: 1BRAH1M)
-    import re
-    # A-Z arasında 1 varsa I yap
-    normalized = re.sub(r'([A-ZÇĞİÖŞÜa-zçğıöşü])1([A-ZÇĞİÖŞÜa-zçğıöşü])', r'\1I\2', normalized)
+    normalized = _NAME_ONE_RE.sub(r'\1I\2', normalized)
     
     # 0 için benzer mantık (0SMAN -> OSMAN)
     if normalized.startswith("0"):
         normalized = "O" + normalized[1:]
     normalized = normalized.replace(" 0", " O")
-    normalized = re.sub(r'([A-ZÇĞİÖŞÜa-zçğıöşü])0([A-ZÇĞİÖŞÜa-zçğıöşü])', r'\1O\2', normalized)
+    normalized = _NAME_ZERO_RE.sub(r'\1O\2', normalized)
     
     return normalized
 
 
-def _apply_patterns(text: str, patterns: ReceiptPatterns) -> FieldMap:
-    """Pattern setindeki alanları yakalayarak sözlük döndür."""
+def _match_at_starts(
+    pattern: Pattern[str], text: str, folded_text: str, starts: Tuple[str, ...]
+) -> Optional[Match[str]]:
+    """
+    Deseni yalnızca başlangıç kelimelerinin geçtiği konumlarda dene.
+
+    Konumlar soldan sağa denendiği için ilk başarılı `match`,
+    `pattern.search(text)` ile aynı sonucu verir; başlık alternatifleri
+    metnin her karakterinde yeniden denenmez.
+    """
+
+    positions = set()
+    for word in starts:
+        index = folded_text.find(word)
+        while index != -1:
+            positions.add(index)
+            index = folded_text.find(word, index + 1)
+
+    for position in sorted(positions):
+        match = pattern.match(text, position)
+        if match:
+            return match
+    return None
+
+
+def _apply_patterns(
+    text: str,
+    patterns: ReceiptPatterns,
+    folded_text: Optional[str] = None,
+    has_iban: Optional[bool] = None,
+) -> FieldMap:
+    """
+    Pattern setindeki alanları yakalayarak sözlük döndür.
+
+    Çapası metinde geçmeyen alanların deseni hiç çalıştırılmaz; metinde
+    IBAN gövdesi yoksa `receiver_iban` de atlanır. `folded_text` ve
+    `has_iban` verilmezse metinden üretilir.
+    """
+
+    if folded_text is None:
+        folded_text = fold_for_anchors(text)
+    if has_iban is None:
+        has_iban = find_iban_start(folded_text) != -1
 
     matches: MutableMapping[str, str] = {}
 
-    for field_name, pattern in asdict(patterns).items():
-        if pattern is None:
+    for field_name, pattern, anchor, starts in patterns.field_patterns:
+        if anchor and anchor not in folded_text:
             continue
-        match = pattern.search(text)
+        if field_name == "receiver_iban" and not has_iban:
+            continue
+        if starts:
+            match = _match_at_starts(pattern, text, folded_text, starts)
+        else:
+            match = pattern.search(text)
         if match and match.group(1):
             matches[field_name] = clean_field_value(match.group(1))
 
@@ -174,15 +236,19 @@ def extract_fields(text: str, bank_hint: Optional[str] = None) -> FieldMap:
 
     normalized_text = text.strip()
 
-    candidate_results: Dict[str, FieldMap] = {"generic": _apply_patterns(normalized_text, GENERIC_PATTERNS)}
+    folded_text = fold_for_anchors(normalized_text)
+    has_iban = find_iban_start(folded_text) != -1
+    candidate_results: Dict[str, FieldMap] = {
+        "generic": _apply_patterns(normalized_text, GENERIC_PATTERNS, folded_text, has_iban)
+    }
 
     if bank_hint:
         patterns = BANK_SPECIFIC_PATTERNS.get(bank_hint.lower())
         if patterns:
-            candidate_results[bank_hint.lower()] = _apply_patterns(normalized_text, patterns)
+            candidate_results[bank_hint.lower()] = _apply_patterns(normalized_text, patterns, folded_text, has_iban)
     else:
         for bank, patterns in BANK_SPECIFIC_PATTERNS.items():
-            candidate_results[bank] = _apply_patterns(normalized_text, patterns)
+            candidate_results[bank] = _apply_patterns(normalized_text, patterns, folded_text, has_iban)
 
     _, best_fields = _choose_best_result(candidate_results)
 
@@ -236,16 +302,10 @@ def extract_fields(text: str, bank_hint: Optional[str] = None) -> FieldMap:
     
     # Description'dan istenmeyen prefix'leri temizle + OCR hataları düzelt
     if best_fields.get("description"):
-        import re
         desc = best_fields["description"]
-        # VALÖR tarihini kaldır
-        desc = re.sub(r'VALÖR\s*[:\-]?\s*\d{2}\.\d{2}\.\d{4}\s*', '', desc, flags=re.IGNORECASE)
-        # İŞLEM YERİ + banka adını kaldır
-        desc = re.sub(r'İŞLEM\s+YERİ\s*[:\-]?\s*[A-ZÇĞİÖŞÜ\s]+', '', desc, flags=re.IGNORECASE)
-        # Banka mobil uygulamalarını kaldır
-        desc = re.sub(r'(ZİRAAT|HALKBANK|KUVEYT\s+TÜRK|YAPI\s+KREDİ)\s+MOBİL\s*', '', desc, flags=re.IGNORECASE)
-        # Başta kalan iki nokta, tire, boşlukları temizle
-        desc = re.sub(r'^[:\-\s]+', '', desc)
+        # VALÖR tarihi, İŞLEM YERİ, banka mobil ekleri ve baştaki ayraçları kaldır
+        for pattern in _DESCRIPTION_STRIP_RES:
+            desc = pattern.sub('', desc)
         # OCR hataları: 0 yerine O, 1 yerine l/I
         desc = desc.replace("0", "O").replace("1", "I")  # Descriptive text için tersini yap - sayıları harfleştirme
         # Çift boşlukları tek yap
@@ -7,8 +7,9 @@ PDF'den görselleri çıkarır, referans logolar ile karşılaştırarak bankay
 from __future__ import annotations
 
 import io
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 try:
     import cv2
@@ -38,6 +39,15 @@ BANK_LOGOS: Dict[str, List[str]] = {
     "vakifbank": ["vakifbank_logo.png", "vakifbank_logo.jpg"],
 }
 
+# Coarse-to-fine eşleştirme için piramit seviye sayısı (0 = tam çözünürlük)
+PYRAMID_LEVELS = 3
+
+# Kaba seviyede bu kadar eşik altında kalan eşleşmeler tam çözünürlükte denenmez
+COARSE_REJECT_MARGIN = 0.1
+
+# Kaba seviyede template'in en az bu boyutta olması gerekir (piksel)
+MIN_COARSE_TEMPLATE_SIZE = 8
+
 
 def extract_images_from_pdf(pdf_path: str | Path) -> List[np.ndarray]:
     """
@@ -82,6 +92,31 @@ def extract_images_from_pdf(pdf_path: str | Path) -> List[np.ndarray]:
     return images
 
 
+def _to_gray(image: np.ndarray) -> np.ndarray:
+    """RGB görseli gri tonlamaya çevirir (zaten griyse olduğu gibi döner)."""
+    return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY) if len(image.shape) == 3 else image
+
+
+def build_pyramid(image: np.ndarray, levels: int = PYRAMID_LEVELS) -> Tuple[np.ndarray, ...]:
+    """
+    Görselin gri tonlamalı Gauss piramidini oluşturur.
+
+    Parametreler:
+        image: Kaynak görsel (RGB veya gri).
+        levels: Piramit seviye sayısı (ilk seviye tam çözünürlük).
+
+    Dönen:
+        Tam çözünürlükten en küçüğe doğru sıralı görsel tuple'ı.
+    """
+    pyramid = [_to_gray(image)]
+    for _ in range(levels - 1):
+        previous = pyramid[-1]
+        if min(previous.shape[:2]) < 2:
+            break
+        pyramid.append(cv2.pyrDown(previous))
+    return tuple(pyramid)
+
+
 def load_reference_logo(bank_name: str) -> Optional[np.ndarray]:
     """
     Referans logo dosyasını yükler.
@@ -108,14 +143,69 @@ def load_reference_logo(bank_name: str) -> Optional[np.ndarray]:
     return None
 
 
-def template_match(image: np.ndarray, template: np.ndarray, threshold: float = 0.6) -> float:
+@lru_cache(maxsize=None)
+def _load_reference_logo_pyramid(bank_name: str) -> Tuple[np.ndarray, ...]:
+    """Logo piramidini yükler; logo yoksa LookupError (başarısızlık cache'lenmez)."""
+    logo = load_reference_logo(bank_name)
+    if logo is None:
+        raise LookupError(bank_name)
+    return build_pyramid(logo)
+
+
+def load_reference_logo_pyramid(bank_name: str) -> Optional[Tuple[np.ndarray, ...]]:
+    """
+    Referans logonun gri tonlamalı piramidini yükler (banka başına bir kez).
+
+    Yalnızca başarılı yüklemeler cache'lenir; sonradan eklenen logo bir
+    sonraki çağrıda bulunur.
+
+    Parametreler:
+        bank_name: Banka adı (ör. "halkbank").
+
+    Dönen:
+        Piramit seviyeleri tuple'ı veya None.
+    """
+    try:
+        return _load_reference_logo_pyramid(bank_name)
+    except LookupError:
+        return None
+
+
+def clear_caches() -> None:
+    """Referans logo piramidi cache'ini temizler (logo dosyaları değiştiğinde)."""
+    _load_reference_logo_pyramid.cache_clear()
+
+
+def _match_score(img_gray: np.ndarray, template_gray: np.ndarray) -> Optional[float]:
+    """Tek seviyede TM_CCOEFF_NORMED skorunu döndürür; template sığmıyorsa None."""
+    if template_gray.shape[0] > img_gray.shape[0] or template_gray.shape[1] > img_gray.shape[1]:
+        return None
+
+    result = cv2.matchTemplate(img_gray, template_gray, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, _ = cv2.minMaxLoc(result)
+    return float(max_val)
+
+
+def template_match(
+    image: np.ndarray,
+    template: np.ndarray,
+    threshold: float = 0.6,
+    image_pyramid: Optional[Sequence[np.ndarray]] = None,
+    template_pyramid: Optional[Sequence[np.ndarray]] = None,
+) -> float:
     """
     Template matching kullanarak görsel benzerliğini hesaplar.
 
+    Önce piramidin en küçük seviyesinde eşleştirme yapılır; skor
+    `threshold - COARSE_REJECT_MARGIN` altındaysa tam çözünürlüğe geçilmeden
+    kaba skor döndürülür (erken ret).
+
     Parametreler:
         image: Aranacak görsel (PDF'den çıkarılan).
         template: Referans logo (template).
         threshold: Minimum benzerlik eşiği (0-1 arası).
+        image_pyramid: (opsiyonel) `build_pyramid(image)` çıktısı.
+        template_pyramid: (opsiyonel) `build_pyramid(template)` çıktısı.
 
     Dönen:
         Benzerlik skoru (0-1 arası).
@@ -124,23 +214,60 @@ def template_match(image: np.ndarray, template: np.ndarray, threshold: float = 0
         return 0.0
 
     try:
-        # Görselleri gri tonlamaya çevir
-        img_gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY) if len(image.shape) == 3 else image
-        template_gray = cv2.cvtColor(template, cv2.COLOR_RGB2GRAY) if len(template.shape) == 3 else template
+        if image_pyramid is None:
+            image_pyramid = build_pyramid(image)
+        if template_pyramid is None:
+            template_pyramid = build_pyramid(template)
+
+        img_gray = image_pyramid[0]
+        template_gray = template_pyramid[0]
 
         # Template görseli, ana görselden büyük olamaz
         if template_gray.shape[0] > img_gray.shape[0] or template_gray.shape[1] > img_gray.shape[1]:
             return 0.0
 
-        # Template matching yap
-        result = cv2.matchTemplate(img_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+        # Kaba seviye: hızlı ret
+        level = min(len(image_pyramid), len(template_pyramid)) - 1
+        if level > 0 and min(template_pyramid[level].shape[:2]) >= MIN_COARSE_TEMPLATE_SIZE:
+            coarse_score = _match_score(image_pyramid[level], template_pyramid[level])
+            if coarse_score is not None and coarse_score < threshold - COARSE_REJECT_MARGIN:
+                return coarse_score
 
-        return float(max_val)
+        # Tam çözünürlükte template matching yap
+        score = _match_score(img_gray, template_gray)
+        return score if score is not None else 0.0
     except Exception:
         return 0.0
 
 
+def _best_bank_scores(images: List[np.ndarray], threshold: float) -> Dict[str, float]:
+    """Her banka için en iyi logo skorunu hesaplar (eşik üstündekiler)."""
+    image_pyramids = [build_pyramid(image) for image in images]
+    bank_scores: Dict[str, float] = {}
+
+    # Her banka için referans logoyu yükle ve karşılaştır
+    for bank_name in BANK_LOGOS.keys():
+        template_pyramid = load_reference_logo_pyramid(bank_name)
+        if template_pyramid is None:
+            continue
+
+        best_match = 0.0
+        for image, image_pyramid in zip(images, image_pyramids):
+            match_score = template_match(
+                image,
+                template_pyramid[0],
+                threshold,
+                image_pyramid=image_pyramid,
+                template_pyramid=template_pyramid,
+            )
+            best_match = max(best_match, match_score)
+
+        if best_match >= threshold:
+            bank_scores[bank_name] = best_match
+
+    return bank_scores
+
+
 def detect_bank_from_logos(pdf_path: str | Path, threshold: float = 0.6) -> Optional[str]:
     """
     PDF'den çıkarılan logoları kullanarak bankayı tespit eder.
@@ -160,21 +287,7 @@ def detect_bank_from_logos(pdf_path: str | Path, threshold: float = 0.6) -> Opti
     if not images:
         return None
 
-    bank_scores: Dict[str, float] = {}
-
-    # Her banka için referans logoyu yükle ve karşılaştır
-    for bank_name in BANK_LOGOS.keys():
-        reference_logo = load_reference_logo(bank_name)
-        if reference_logo is None:
-            continue
-
-        best_match = 0.0
-        for image in images:
-            match_score = template_match(image, reference_logo, threshold)
-            best_match = max(best_match, match_score)
-
-        if best_match >= threshold:
-            bank_scores[bank_name] = best_match
+    bank_scores = _best_bank_scores(images, threshold)
 
     if not bank_scores:
         return None
@@ -204,20 +317,7 @@ def detect_bank_from_logos_with_confidence(
     if not images:
         return None, 0.0
 
-    bank_scores: Dict[str, float] = {}
-
-    for bank_name in BANK_LOGOS.keys():
-        reference_logo = load_reference_logo(bank_name)
-        if reference_logo is None:
-            continue
-
-        best_match = 0.0
-        for image in images:
-            match_score = template_match(image, reference_logo, threshold)
-            best_match = max(best_match, match_score)
-
-        if best_match >= threshold:
-            bank_scores[bank_name] = best_match
+    bank_scores = _best_bank_scores(images, threshold)
 
     if not bank_scores:
         return None, 0.0
@@ -241,6 +341,9 @@ __all__ = [
     "detect_bank_from_logos_with_confidence",
     "extract_images_from_pdf",
     "load_reference_logo",
+    "load_reference_logo_pyramid",
+    "clear_caches",
+    "build_pyramid",
     "template_match",
     "BANK_LOGOS",
     "LOGO_DIR",
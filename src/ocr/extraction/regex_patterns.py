@@ -8,8 +8,14 @@ Python ortamında kullanılmaya hazır hale getirilmiştir.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Dict, Pattern
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from typing import Dict, Optional, Pattern, Tuple
+
+
+# `re.IGNORECASE` altında ASCII harflerle eşleşen ASCII dışı karakterler
+# (Türkçe ı/İ, uzun s, Kelvin işareti). Çapa kontrolünde bunlar da katlanır.
+_ANCHOR_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
 
 
 @dataclass(frozen=True)
@@ -24,10 +30,89 @@ class ReceiptPatterns:
     amount: Pattern[str] | None = None
     currency: Pattern[str] | None = None
     date: Pattern[str] | None = None
+    # Alan adı -> desenin eşleşmesi için metinde mutlaka geçmesi gereken
+    # küçük harfli ASCII parça. Parça yoksa desen hiç çalıştırılmaz.
+    anchors: Dict[str, str] = field(default_factory=dict, compare=False)
+    # Alan adı -> eşleşmenin başlayabileceği küçük harfli ASCII/Türkçe
+    # kelimeler (ör. başlık alternatiflerinin ilk kelimeleri). Verilen alanlarda
+    # desen yalnızca bu kelimelerin geçtiği konumlarda `match` ile denenir.
+    starts: Dict[str, Tuple[str, ...]] = field(default_factory=dict, compare=False)
+
+    @cached_property
+    def field_patterns(
+        self,
+    ) -> Tuple[Tuple[str, Pattern[str], Optional[str], Tuple[str, ...]], ...]:
+        """Tanımlı (None olmayan) alan desenleri, çapaları ve başlangıç kelimeleri (ilk erişimde hesaplanır)."""
+
+        return tuple(
+            (
+                item.name,
+                getattr(self, item.name),
+                self.anchors.get(item.name),
+                self.starts.get(item.name, ()),
+            )
+            for item in fields(self)
+            if item.name not in ("anchors", "starts") and getattr(self, item.name) is not None
+        )
+
+
+def fold_for_anchors(text: str) -> str:
+    """
+    Metni çapa kontrolü için katlar.
+
+    Parametreler:
+        text: Ham OCR metni.
+
+    Dönen:
+        `re.IGNORECASE` ile eşleşebilecek her ASCII harfi küçük hâline
+        indirgenmiş metin; `anchor in folded` kontrolü böylece desen
+        eşleşmesinin gerekli koşulu olur. Katlanmış metin orijinalle aynı
+        uzunluktadır, indeksler birebir karşılık gelir.
+    """
+
+    return text.translate(_ANCHOR_FOLD).lower()
+
+
+def find_iban_start(folded_text: str) -> int:
+    """
+    Metindeki ilk Türk IBAN gövdesinin başlangıcını regex kullanmadan bulur.
+
+    `TR\\d{2}[\\s\\d]{10,}` biçimini (`receiver_iban` desenlerinin ortak
+    yakalama grubu) `str.find` ve karakter kontrolleriyle tarar; bulunamazsa
+    hiçbir `receiver_iban` deseni eşleşemez.
+
+    Parametreler:
+        folded_text: `fold_for_anchors` ile katlanmış metin.
+
+    Dönen:
+        IBAN'ın başladığı indeks; yoksa -1.
+    """
+
+    start = folded_text.find("tr")
+    while start != -1:
+        check = folded_text[start + 2:start + 4]
+        if len(check) == 2 and check.isdecimal():
+            tail = folded_text[start + 4:start + 14]
+            if len(tail) == 10 and all(char.isdecimal() or char.isspace() for char in tail):
+                return start
+        start = folded_text.find("tr", start + 1)
+    return -1
 
 
 def _compile(pattern: str) -> Pattern[str]:
-    """Kullanışlı olması için inline flag içeren regexleri derler."""
+    """
+    Kullanışlı olması için inline flag içeren regexleri derler.
+
+    Not: Desenler bilinçli olarak standart `re` ile derlenir. RE2
+    `\\uXXXX` kaçışlarını desteklemez; RE2 ve PCRE2 (JIT dahil) IGNORECASE
+    altında Türkçe "ı"/"İ" harflerini "I" ile eşlemez. "ALICI" deseninin
+    OCR'daki "Alıcı" yazımını yakalaması bu katlamaya dayanır. Hyperscan
+    da yalnızca ASCII katlama yapar ve yakalama grubu döndürmez (yalnızca
+    eşleşme konumu); tek geçişlik ön eleme zaten `anchors`/`starts`
+    kontrolleriyle (`str` aramaları) yapıldığından ek kazanç sağlamaz. Motor
+    değişikliği yapılacaksa desenler önce bu farklara göre yeniden
+    yazılmalıdır (ör. "ALICI" yerine "AL[Iıİ]C[Iıİ]").
+    """
 
     return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
 
@@ -51,6 +136,19 @@ BANK_SPECIFIC_PATTERNS: Dict[str, ReceiptPatterns] = {
             r"\u0130[\u015eS]LEM\s*TUTARI\s*[:\-]?\s*(?:.*?)?[0-9,.]+\s*(TL|\u20ba|USD|EUR|GBP)"
         ),
         date=_compile(r"\u0130[\u015eS]LEM\s*TAR\u0130H\u0130\s*[:\-]?\s*(.+?)(?:\n|$)"),
+        anchors={
+            "recipient": "alici",
+            "receiver_iban": "alici",
+            "sender": "nderen",
+            "description": "iklamasi",
+            "amount": "tutari",
+            "currency": "tutari",
+            "date": "tarihi",
+        },
+        starts={
+            "amount": ("işlem", "islem"),
+            "currency": ("işlem", "islem"),
+        },
     ),
     "yapikredi": ReceiptPatterns(
         recipient=_compile(
@@ -77,6 +175,17 @@ BANK_SPECIFIC_PATTERNS: Dict[str, ReceiptPatterns] = {
         date=_compile(
             r"I[ŞS]LEM\s*TAR[İI]H[İI]\s*[:\-]?\s*(.+?)(?:\n|$)"
         ),
+        anchors={
+            "receiver_iban": "alici",
+            "sender_iban": "iban",
+            "description": "iklama",
+            "amount": "tutar",
+            "currency": "cinsi",
+            "date": "tarihi",
+        },
+        starts={
+            "amount": ("işlem", "odenen"),
+        },
     ),
     "kuveytturk": ReceiptPatterns(
         recipient=_compile(r"ALICI\s*[:\-]?\s*(.+?)(?:\n|$)"),
@@ -97,6 +206,19 @@ BANK_SPECIFIC_PATTERNS: Dict[str, ReceiptPatterns] = {
         date=_compile(
             r"\u0130[\u015eS]LEM\s*TAR[\u0130I]H[\u0130I]\s*[:\-]?\s*(.+?)(?:\n|$)"
         ),
+        anchors={
+            "recipient": "alici",
+            "receiver_iban": "iban",
+            "sender": "nderen",
+            "description": "iklama",
+            "amount": "tutar",
+            "currency": "tutar",
+            "date": "tarihi",
+        },
+        starts={
+            "amount": ("tutar",),
+            "currency": ("tutar",),
+        },
     ),
     "halkbank": ReceiptPatterns(
         recipient=_compile(
@@ -127,6 +249,16 @@ BANK_SPECIFIC_PATTERNS: Dict[str, ReceiptPatterns] = {
         date=_compile(
             r"(?:İŞLEM\s+TARİHİ|\u0130[\u015eS]LEM\s*TAR[\u0130I]H[\u0130I]|Tarih|Val[öo]r)\s*[:\-]?\s*(.+?)(?:\n|$)"
         ),
+        anchors={
+            "receiver_iban": "iban",
+            "sender": "nderen",
+            "sender_iban": "iban",
+            "description": "iklama",
+        },
+        starts={
+            "amount": ("işlem", "islem", "ith", "toplam"),
+            "currency": ("işlem", "islem", "toplam", "döviz"),
+        },
     ),
     "ziraatbank": ReceiptPatterns(
         recipient=_compile(
@@ -154,6 +286,20 @@ BANK_SPECIFIC_PATTERNS: Dict[str, ReceiptPatterns] = {
         date=_compile(
             r"İŞLEM\s+TARİHİ\s*[:\-]?\s*(?:\n.*?){7,9}:\s*([0-9/]+-[0-9:]+)"
         ),
+        anchors={
+            "recipient": "alici",
+            "receiver_iban": "alici",
+            "sender": "nderen",
+            "sender_iban": "iban",
+            "description": "mesaj",
+            "amount": "tutar",
+            "currency": "tutar",
+            "date": "tarihi",
+        },
+        starts={
+            "amount": ("işlem",),
+            "currency": ("işlem",),
+        },
     ),
 }
 
@@ -173,6 +319,16 @@ GENERIC_PATTERNS = ReceiptPatterns(
     date=_compile(
         r"(?:\u0130[\u015eS]LEM\s*TAR[\u0130I]H[\u0130I]|I[\u015eS]LEM\s*TAR[İI]H[İI]|TAR[\u0130I]H|Tarih)\s*[:\-]?\s*(.+?)(?:\n|$)"
     ),
+    anchors={
+        "recipient": "alici",
+        "description": "iklama",
+        "currency": "tutar",
+        "date": "tarih",
+    },
+    starts={
+        "amount": ("işlem", "islem", "tutar", "havale", "giden", "eft", "transfer", "para", "miktar"),
+        "currency": ("tutar",),
+    },
 )
 
 
@@ -0,0 +1,103 @@
+"""
+JSON okuma/yazma yardımcıları.
+
+orjson kuruluysa onunla, değilse standart `json` ile çalışır. Eşleştirme
+CLI'ı ve pipeline (`src/pipeline/database_loader.py`) aynı yardımcıları
+kullanır.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# Hızlı JSON okuma/yazma (opsiyonel bağımlılık, yoksa stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Aynı süreçte parse edilmiş halde tutulacak farklı JSON dosyası sayısı
+JSON_CACHE_SIZE = 8
+
+
+def read_json(path: Path | str) -> Any:
+    """JSON dosyasını oku (orjson kuruluysa onunla)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def loads_json(data: str | bytes) -> Any:
+    """JSON metnini veya baytlarını parse et (orjson kuruluysa onunla)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def dumps_json(data: Any, indent: bool = False) -> str:
+    """
+    Veriyi ASCII'ye kaçırılmamış JSON metnine çevir.
+
+    Parametreler:
+        data: JSON'a çevrilebilir veri (orjson ile sayısal olmayan sözlük
+            anahtarları ve numpy değerleri de desteklenir).
+        indent: 2 boşluk girintili yaz.
+
+    Dönen:
+        JSON metni.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option).decode("utf-8")
+
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
+
+
+def write_json(data: Any, path: Path | str) -> None:
+    """Veriyi 2 boşluk girintili JSON dosyası olarak yaz."""
+    Path(path).write_text(dumps_json(data, indent=True), encoding="utf-8")
+
+
+@lru_cache(maxsize=JSON_CACHE_SIZE)
+def _read_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """JSON dosyasını (yol, değişiklik zamanı, boyut) anahtarıyla bir kez parse et."""
+    return read_json(path_str)
+
+
+def read_json_cached(path: Path | str) -> Any:
+    """
+    JSON dosyasını oku; dosya değişmediği sürece önbellekteki sonucu döndür.
+
+    Dosyanın değiştiği mtime ve boyutundan anlaşılır. Dönen veri
+    çağıranlar arasında paylaşımlıdır, değiştirilmemelidir.
+    """
+    path_str = os.path.abspath(path)
+    st = os.stat(path_str)
+    return _read_json_cached(path_str, st.st_mtime_ns, st.st_size)
+
+
+def clear_json_cache() -> None:
+    """Önbellekteki tüm JSON dosyalarını bırak."""
+    _read_json_cached.cache_clear()
+
+
+__all__ = [
+    "ORJSON_AVAILABLE",
+    "read_json",
+    "loads_json",
+    "dumps_json",
+    "write_json",
+    "read_json_cached",
+    "clear_json_cache",
+]
@@ -1,6 +1,19 @@
 """Dekont eşleştirme modülleri."""
 
-from .matcher import MATCHING_CRITERIA, match_receipt, ReceiptMatchResult
+from .matcher import (
+    MATCHING_CRITERIA,
+    build_address_index,
+    build_bigram_index,
+    build_iban_index,
+    build_name_index,
+    build_normalized_iban_index,
+    build_owner_name_index,
+    build_property_index,
+    match_receipt,
+    match_receipts,
+    prepare_matching_db,
+    ReceiptMatchResult,
+)
 from .mapper import map_ocr_to_receipt_fields, update_receipt_with_match
 from .normalizers import (
     normalize_amount,
@@ -10,13 +23,26 @@ from .normalizers import (
 )
 from .fuzzy import (
     address_similarity,
+    address_similarity_precomputed,
     jaccard_similarity,
     levenshtein_similarity,
     name_similarity,
+    name_similarity_batch,
+    name_similarity_matrix,
+    ngram_set,
 )
 
 __all__ = [
     "match_receipt",
+    "match_receipts",
+    "build_iban_index",
+    "build_normalized_iban_index",
+    "build_owner_name_index",
+    "build_property_index",
+    "build_address_index",
+    "build_name_index",
+    "build_bigram_index",
+    "prepare_matching_db",
     "ReceiptMatchResult",
     "MATCHING_CRITERIA",
     "map_ocr_to_receipt_fields",
@@ -26,7 +52,11 @@ __all__ = [
     "normalize_amount",
     "normalize_date",
     "name_similarity",
+    "name_similarity_batch",
+    "name_similarity_matrix",
+    "ngram_set",
     "address_similarity",
+    "address_similarity_precomputed",
     "levenshtein_similarity",
     "jaccard_similarity",
 ]
@@ -7,10 +7,10 @@ Mock data veya gerçek OCR çıktısı ile eşleştirme testi yapar.
 from __future__ import annotations
 
 import argparse
-import json
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 try:
     from pdfminer.high_level import extract_text
@@ -20,18 +20,50 @@ except ImportError:
 
 from ocr.extraction.extractor import extract_fields
 from ocr.extraction.bank_detector import detect_bank
-from ocr.matching.matcher import match_receipt, ReceiptMatchResult
+from ocr.matching.matcher import (
+    match_receipt,
+    prepare_matching_db,
+    ReceiptMatchResult,
+)
 from ocr.matching.mapper import map_ocr_to_receipt_fields
+from ocr.jsonio import JSON_CACHE_SIZE, dumps_json, read_json, read_json_cached
 
 
-def load_mock_data(mock_data_path: Path | str) -> Dict[str, Any]:
-    """Mock data JSON dosyasını yükle."""
+@lru_cache(maxsize=JSON_CACHE_SIZE)
+def _matching_db_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Mock data için eşleştirme indekslerini bir kez hazırla."""
+    records = read_json_cached(path_str)["database_records"]
+    return prepare_matching_db(records["owners"], records["customers"], records["properties"])
+
+
+def _cache_key(mock_data_path: Path | str) -> tuple[str, int, int]:
+    """Mock data dosyası için (mutlak yol, mtime_ns, boyut) cache anahtarı."""
     path = Path(mock_data_path)
     if not path.exists():
         raise FileNotFoundError(f"Mock data dosyası bulunamadı: {path}")
     
-    with open(path) as f:
-        return json.load(f)
+    resolved = path.resolve()
+    st = resolved.stat()
+    return str(resolved), st.st_mtime_ns, st.st_size
+
+
+def load_mock_data(mock_data_path: Path | str) -> Dict[str, Any]:
+    """
+    Mock data JSON dosyasını yükle.
+    
+    Dosya değişmediği sürece aynı süreçteki çağrılar önbellekteki sözlüğü
+    döndürür; dönen veri paylaşımlıdır, değiştirilmemelidir.
+    """
+    return read_json_cached(_cache_key(mock_data_path)[0])
+
+
+def load_matching_db(mock_data_path: Path | str) -> Dict[str, Any]:
+    """
+    Mock data için önbellekli `prepare_matching_db` çıktısını döndür.
+    
+    Dönen sözlük `match_receipt(..., **prepared)` ile verilir.
+    """
+    return _matching_db_cached(*_cache_key(mock_data_path))
 
 
 def match_from_pdf(
@@ -71,6 +103,7 @@ def match_from_pdf(
         customers=customers,
         properties=properties,
         min_confidence=min_confidence,
+        **load_matching_db(mock_data_path),
     )
     
     return result, ocr_data, detected_bank
@@ -93,8 +126,7 @@ def match_from_ocr_json(
         ReceiptMatchResult objesi.
     """
     # OCR JSON'ı yükle
-    with open(ocr_json_path) as f:
-        ocr_data = json.load(f)
+    ocr_data = read_json(ocr_json_path)
     
     # Mock data'yı yükle
     mock_data = load_mock_data(mock_data_path)
@@ -109,6 +141,7 @@ def match_from_ocr_json(
         customers=customers,
         properties=properties,
         min_confidence=min_confidence,
+        **load_matching_db(mock_data_path),
     )
     
     return result, ocr_data, None
@@ -168,6 +201,7 @@ def match_mock_receipt(
         customers=customers,
         properties=properties,
         min_confidence=min_confidence,
+        **load_matching_db(mock_data_path),
     )
     
     return result, ocr_formatted, receipt.get("beklenen_esleme")
@@ -330,7 +364,7 @@ def main(argv: list[str] | None = None) -> int:
                 "sender_match_score": result.sender_match_score,
                 "messages": result.messages,
             }
-            print(json.dumps(output, indent=2, ensure_ascii=False))
+            print(dumps_json(output, indent=True))
         else:
             print_match_result(result, ocr_data, expected, detected_bank)
         
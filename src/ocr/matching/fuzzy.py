@@ -2,11 +2,298 @@
 Fuzzy matching ve benzerlik hesaplama fonksiyonları.
 
 Levenshtein distance ve Jaccard similarity kullanır.
+rapidfuzz kuruluysa Levenshtein hesapları C implementasyonuna devredilir,
+yoksa stringzilla kuruluysa onun SIMD çekirdeği kullanılır;
+numba kuruluysa Levenshtein ve Jaccard çekirdekleri JIT ile derlenir;
+yalnızca numpy kuruluysa uzun stringlerde bigram Jaccard vektörel hesaplanır.
 """
 
 from __future__ import annotations
 
-from typing import List, Tuple
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Sequence, Tuple, Union
+
+# Levenshtein için C hızlandırması (opsiyonel bağımlılık)
+try:
+    from rapidfuzz import process as rf_process
+    from rapidfuzz.distance import Levenshtein as RFLevenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Levenshtein için SIMD hızlandırması (opsiyonel bağımlılık; 4.x'te edit
+# distance ayrı pakete taşındığı için 3.x serisi kullanılır)
+try:
+    import stringzilla as sz
+    STRINGZILLA_AVAILABLE = hasattr(sz, "edit_distance_unicode")
+except ImportError:
+    STRINGZILLA_AVAILABLE = False
+
+# Vektörel bigram Jaccard için numpy (opsiyonel bağımlılık)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Levenshtein/Jaccard çekirdekleri için JIT derleme (opsiyonel bağımlılık)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Numba Myers çekirdeğinde doğrudan tabloyla eşlenen kod noktası sınırı
+# (U+0000-U+017F: ASCII, Latin-1 ve Türkçe harfleri içeren Latin Extended-A)
+MYERS_TABLE_SIZE = 0x180
+
+# Numba Jaccard çekirdeğinin desteklediği maksimum n-gram boyutu
+# (her karakter 21 bit; n-gram + uzunluk etiketi int64'e sığmalı)
+NUMBA_MAX_NGRAM = 2
+
+# Bu uzunluğun altındaki stringlerde bit maskeli bigram Jaccard daha hızlı
+NUMPY_JACCARD_MIN_LENGTH = 96
+
+if NUMPY_AVAILABLE:
+
+    def _code_points(text: str) -> np.ndarray:
+        """String'i unicode kod noktası dizisine çevirir."""
+        return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+    def _bigram_codes(text: str) -> np.ndarray:
+        """Bigram'ları tek int64 koda paketler (her karakter 21 bit), sıralı ve unique."""
+        points = _code_points(text).astype(np.int64)
+        return np.unique((points[:-1] << 21) | points[1:])
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, boundscheck=False)
+    def _lev_core(a: np.ndarray, b: np.ndarray) -> int:
+        """Kod noktası dizileri üzerinde iki satırlı Levenshtein DP."""
+        n = a.shape[0]
+        m = b.shape[0]
+        if n < m:
+            a, b = b, a
+            n, m = m, n
+        if m == 0:
+            return n
+
+        previous_row = np.arange(m + 1).astype(np.int32)
+        current_row = np.empty(m + 1, dtype=np.int32)
+        for i in range(n):
+            current_row[0] = i + 1
+            c1 = a[i]
+            for j in range(m):
+                best = previous_row[j + 1] + 1
+                deletion = current_row[j] + 1
+                if deletion < best:
+                    best = deletion
+                substitution = previous_row[j] + (0 if c1 == b[j] else 1)
+                if substitution < best:
+                    best = substitution
+                current_row[j + 1] = best
+            previous_row, current_row = current_row, previous_row
+
+        return previous_row[m]
+
+    @njit(cache=True, boundscheck=False)
+    def _myers_core(text: np.ndarray, pattern: np.ndarray) -> int:
+        """
+        Myers/Hyyrö bit-parallel Levenshtein (uint64 bit vektörleri).
+        
+        `pattern` 1-64 kod noktası olmalı. Karakter maskeleri Latin
+        Extended-A'ya kadar (tüm Türkçe harfler) doğrudan tablodan okunur;
+        daha büyük kod noktaları pattern üzerinde taranır.
+        """
+        m = pattern.shape[0]
+        one = np.uint64(1)
+        zero = np.uint64(0)
+        
+        # Her karakterin pattern'daki pozisyonları (bitmask)
+        peq = np.zeros(MYERS_TABLE_SIZE, dtype=np.uint64)
+        has_wide = False
+        for j in range(m):
+            char = pattern[j]
+            if char < MYERS_TABLE_SIZE:
+                peq[char] |= one << np.uint64(j)
+            else:
+                has_wide = True
+        
+        mask = ~zero if m == 64 else (one << np.uint64(m)) - one
+        last_bit = one << np.uint64(m - 1)
+        
+        vp = mask
+        vn = zero
+        score = m
+        for i in range(text.shape[0]):
+            char = text[i]
+            if char < MYERS_TABLE_SIZE:
+                eq = peq[char]
+            else:
+                eq = zero
+                if has_wide:
+                    for j in range(m):
+                        if pattern[j] == char:
+                            eq |= one << np.uint64(j)
+            
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            hp = vn | ~(xh | vp)
+            hn = vp & xh
+            if hp & last_bit:
+                score += 1
+            elif hn & last_bit:
+                score -= 1
+            hp = (hp << one) | one
+            hn = hn << one
+            vp = (hn | ~(xv | hp)) & mask
+            vn = hp & xv
+        
+        return score
+
+    @njit(cache=True, boundscheck=False)
+    def _ngram_codes(a: np.ndarray, n: int) -> np.ndarray:
+        """N-gram'ları (uzunluk etiketli) int64 kodlara çevirir, sıralı ve unique."""
+        length = a.shape[0]
+        if length < n:
+            code = np.int64(0)
+            for k in range(length):
+                code = (code << 21) | np.int64(a[k])
+            out = np.empty(1, dtype=np.int64)
+            out[0] = (code << 2) | length
+            return out
+
+        count = length - n + 1
+        out = np.empty(count, dtype=np.int64)
+        for i in range(count):
+            code = np.int64(0)
+            for k in range(n):
+                code = (code << 21) | np.int64(a[i + k])
+            out[i] = (code << 2) | n
+        return np.unique(out)
+
+    @njit(cache=True, boundscheck=False)
+    def _jaccard_core(a: np.ndarray, b: np.ndarray, n: int) -> float:
+        """Sıralı n-gram kodları üzerinde merge ile Jaccard similarity."""
+        grams1 = _ngram_codes(a, n)
+        grams2 = _ngram_codes(b, n)
+        i = 0
+        j = 0
+        intersection = 0
+        while i < grams1.shape[0] and j < grams2.shape[0]:
+            if grams1[i] == grams2[j]:
+                intersection += 1
+                i += 1
+                j += 1
+            elif grams1[i] < grams2[j]:
+                i += 1
+            else:
+                j += 1
+        union = grams1.shape[0] + grams2.shape[0] - intersection
+        if union == 0:
+            return 1.0
+        return intersection / union
+
+    # Derlemeyi import sırasında yap (cache=True ile sonraki importlar diskten yükler)
+    try:
+        _lev_core(_code_points("ab"), _code_points("a"))
+        _myers_core(_code_points("ab"), _code_points("a"))
+        _jaccard_core(_code_points("ab"), _code_points("a"), 2)
+    except Exception:
+        NUMBA_AVAILABLE = False
+
+# Benzerlik/keyword memoization cache boyutu
+# Not: desenler/kurallar çalışma anında değiştirilirse clear_caches() çağrılmalı
+SIMILARITY_CACHE_SIZE = 8192
+
+# N-gram -> bit konumu; Jaccard kümeleri int bit maskesi olarak tutulur.
+# İsim/adres bigram'larında alfabe sınırlı olduğundan sözlük birkaç bin girdide kalır.
+_NGRAM_BITS: Dict[str, int] = {}
+_NGRAM_BITS_LOCK = threading.Lock()
+
+# int.bit_count Python 3.10+; öncesinde bin() ile sayılır
+_popcount = getattr(int, "bit_count", None) or (lambda value: bin(value).count("1"))
+
+# Türkçe karakter normalizasyonu (matching için) - tek geçişte str.translate
+_TR_FOLD = str.maketrans("İŞĞÜÖÇışğüöç", "ISGUOCISGUOC")
+
+# Adres keyword çıkarımı için derlenmiş desenler
+# OCR hataları: "M0DA" -> "MODA", "K1RA" -> "KIRA"
+_OCR_ZERO_RE = re.compile(r'([A-Z])0([A-Z])')
+_OCR_ONE_RE = re.compile(r'([A-Z])1([A-Z])')
+
+# Mahalle/Sokak/Cadde adları; her desen yalnızca kendi ekini içeren metinde
+# çalıştırılır. Genel kelime taraması bunları çoğunlukla zaten yakalar, ama
+# stopword olan ("19 MAYIS CAD") veya rakam içeren adları yalnızca bunlar verir.
+_MAH_PATTERNS = (
+    ("MAH", re.compile(r"(\w+(?:\s+\w+)?)\s+MAH(?:ALLE)?(?:SI)?[\.]?")),  # SİNANPAŞA MAH, MODA MAHALLESI
+    ("SOK", re.compile(r"(\w+)\s+SOK(?:AK)?[\.]?")),  # BESTEKAR SOKAK
+    ("CAD", re.compile(r"(\w+)\s+CAD(?:DESI)?[\.]?")),  # DENİZ CADDESİ
+)
+
+# 3-15 harfli büyük harf kelimeler
+_WORD_RE = re.compile(r'\b([A-Z]{3,15})\b')
+
+# Adres keyword'ü sayılmayacak kelimeler (ay adları, para birimleri, banka ifadeleri)
+_STOPWORDS: FrozenSet[str] = frozenset({
+    "KIRA", "RENT", "KASIM", "ARALIK", "OCAK", "SUBAT", "MART",
+    "NISAN", "MAYIS", "HAZIRAN", "TEMMUZ", "AGUSTOS", "EYLUL",
+    "EKIM", "TL", "TRY", "USD", "EUR", "FAST", "MESAJ", "HAVALE",
+})
+
+# Daire/Kat/No numaraları; tek finditer geçişinde (önek, numara) çiftleri.
+# Eşleşmeler yalnızca önek + [:\s]* + rakam içerdiğinden önekler birbirinin
+# eşleşmesiyle çakışmaz; ayrı desenlerle aynı sonucu verir.
+_NUM_RE = re.compile(r"(DAIRE|KAT|NO)[:\s]*([0-9]+)")
+
+# Myers bit-parallel algoritmasının kullanılacağı maksimum pattern uzunluğu
+# (bit vektörü tek bir 64-bit kelimeye sığar)
+MYERS_MAX_PATTERN_LENGTH = 64
+
+
+def _myers_distance(text: Union[str, bytes], pattern: Union[str, bytes]) -> int:
+    """
+    Myers/Hyyrö bit-parallel Levenshtein distance.
+    
+    DP tablosunun bir sütunu `pattern` uzunluğunda bit vektörleri (VP/VN)
+    olarak tutulur; `text`'teki her karakter için birkaç bit işlemiyle
+    güncellenir. `pattern` boş olmamalıdır. ASCII girdiler `bytes` olarak
+    verilirse karakter tablosu 256 elemanlı listeden okunur.
+    """
+    m = len(pattern)
+    mask = (1 << m) - 1
+    last_bit = 1 << (m - 1)
+    
+    # Her karakterin pattern'daki pozisyonları (bitmask)
+    if isinstance(pattern, bytes):
+        peq = [0] * 256
+    else:
+        peq = dict.fromkeys(text, 0)
+        peq.update(dict.fromkeys(pattern, 0))
+    for i, char in enumerate(pattern):
+        peq[char] |= 1 << i
+    
+    vp = mask
+    vn = 0
+    score = m
+    for char in text:
+        eq = peq[char]
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        if hp & last_bit:
+            score += 1
+        elif hn & last_bit:
+            score -= 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & mask
+        vn = hp & xv
+    
+    return score
 
 
 def levenshtein_distance(s1: str, s2: str) -> int:
@@ -20,32 +307,71 @@ def levenshtein_distance(s1: str, s2: str) -> int:
     Dönen:
         Levenshtein distance (0 = aynı, daha büyük = daha farklı).
     """
+    if RAPIDFUZZ_AVAILABLE:
+        return RFLevenshtein.distance(s1, s2)
+
+    if STRINGZILLA_AVAILABLE:
+        # ASCII'de byte mesafesi karakter mesafesine eşittir; aksi halde
+        # UTF-8 baytları yerine kod noktaları üzerinden hesaplanmalı
+        if s1.isascii() and s2.isascii():
+            return sz.edit_distance(s1, s2)
+        return sz.edit_distance_unicode(s1, s2)
+
+    # Uzun string s1 olsun (satırlar kısa string üzerinden tutulur)
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
     
     if len(s2) == 0:
         return len(s1)
     
+    if NUMBA_AVAILABLE:
+        if len(s2) <= MYERS_MAX_PATTERN_LENGTH:
+            return int(_myers_core(_code_points(s1), _code_points(s2)))
+        return int(_lev_core(_code_points(s1), _code_points(s2)))
+    
+    # Kısa stringler (isimler, IBAN'lar) için bit-parallel hızlı yol
+    if len(s2) <= MYERS_MAX_PATTERN_LENGTH:
+        if s1.isascii() and s2.isascii():
+            return _myers_distance(s1.encode("ascii"), s2.encode("ascii"))
+        return _myers_distance(s1, s2)
+    
+    # İki satır önceden ayrılır, her satır sonunda referanslar takas edilir.
+    # Sol ve çapraz hücreler yerel değişkenlerde taşınır, satır başına
+    # yalnızca bir okuma ve bir yazma yapılır.
     previous_row = list(range(len(s2) + 1))
+    current_row = [0] * (len(s2) + 1)
     for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+        left = current_row[0] = i + 1
+        diagonal = i
+        for j, c2 in enumerate(s2, 1):
+            above = previous_row[j]
+            # min(above + 1, left + 1, diagonal + (c1 != c2)), çağrısız
+            if c1 != c2:
+                if above < left:
+                    left = above
+                if diagonal < left:
+                    left = diagonal
+                left += 1
+            else:
+                left = diagonal
+            current_row[j] = left
+            diagonal = above
+        previous_row, current_row = current_row, previous_row
     
     return previous_row[-1]
 
 
-def levenshtein_similarity(s1: str, s2: str) -> float:
+@lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def levenshtein_similarity(s1: str, s2: str, threshold: float = 0.0) -> float:
     """
     Levenshtein distance'a göre benzerlik skoru (0-1 arası).
     
     Parametreler:
         s1: İlk string.
         s2: İkinci string.
+        threshold: Bu değerin altındaki skorlar 0.0 döner (rapidfuzz
+            `score_cutoff` gibi). Uzunluk farkı eşiğe ulaşmayı imkansız
+            kılıyorsa mesafe hiç hesaplanmaz.
     
     Dönen:
         Benzerlik skoru (1.0 = aynı, 0.0 = tamamen farklı).
@@ -55,14 +381,60 @@ def levenshtein_similarity(s1: str, s2: str) -> float:
     if not s1 or not s2:
         return 0.0
     
+    if RAPIDFUZZ_AVAILABLE:
+        # 1 - distance / max_len ile aynı normalizasyon
+        return RFLevenshtein.normalized_similarity(s1, s2, score_cutoff=threshold or None)
+    
     max_len = max(len(s1), len(s2))
     if max_len == 0:
         return 1.0
     
+    # Mesafe en az uzunluk farkı kadardır: benzerlik için üst sınır
+    if threshold and 1.0 - abs(len(s1) - len(s2)) / max_len < threshold:
+        return 0.0
+    
     distance = levenshtein_distance(s1, s2)
-    return 1.0 - (distance / max_len)
+    similarity = 1.0 - (distance / max_len)
+    return similarity if similarity >= threshold else 0.0
+
+
+def _get_ngrams(text: str, n: int) -> set:
+    """String'den n-gram'ları çıkarır."""
+    if len(text) < n:
+        return {text}
+    return {text[i:i+n] for i in range(len(text) - n + 1)}
+
+
+@lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def ngram_set(text: str, n_gram: int = 2) -> FrozenSet[str]:
+    """
+    `jaccard_similarity`'nin karşılaştırdığı n-gram kümesini döndürür.
+    
+    Parametreler:
+        text: Metin (boş olmamalı).
+        n_gram: N-gram boyutu (varsayılan: 2, bigram).
+    
+    Dönen:
+        Küçük harfe çevrilmiş metnin n-gram kümesi.
+    """
+    return frozenset(_get_ngrams(text.lower(), n_gram))
+
 
+@lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def _ngram_mask(text: str, n_gram: int = 2) -> int:
+    """`ngram_set(text)`'in bit maskesi; kesişim/birleşim popcount ile sayılır."""
+    mask = 0
+    for gram in ngram_set(text, n_gram):
+        bit = _NGRAM_BITS.get(gram)
+        if bit is None:
+            # Yeni n-gram'a iki iş parçacığı aynı konumu vermesin
+            with _NGRAM_BITS_LOCK:
+                bit = _NGRAM_BITS.setdefault(gram, len(_NGRAM_BITS))
+        mask |= 1 << bit
+    return mask
 
+
+@lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
 def jaccard_similarity(s1: str, s2: str, n_gram: int = 2) -> float:
     """
     Jaccard similarity hesaplar (n-gram bazlı).
@@ -80,31 +452,45 @@ def jaccard_similarity(s1: str, s2: str, n_gram: int = 2) -> float:
     if not s1 or not s2:
         return 0.0
     
-    def get_ngrams(text: str, n: int) -> set:
-        """String'den n-gram'ları çıkarır."""
-        if len(text) < n:
-            return {text}
-        return {text[i:i+n] for i in range(len(text) - n + 1)}
-    
-    set1 = get_ngrams(s1.lower(), n_gram)
-    set2 = get_ngrams(s2.lower(), n_gram)
-    
-    intersection = len(set1 & set2)
-    union = len(set1 | set2)
-    
-    if union == 0:
-        return 1.0
-    
-    return intersection / union
+    if NUMBA_AVAILABLE and 1 <= n_gram <= NUMBA_MAX_NGRAM:
+        return float(_jaccard_core(_code_points(s1.lower()), _code_points(s2.lower()), n_gram))
+    
+    if (
+        NUMPY_AVAILABLE
+        and n_gram == 2
+        and len(s1) >= NUMPY_JACCARD_MIN_LENGTH
+        and len(s2) >= NUMPY_JACCARD_MIN_LENGTH
+    ):
+        grams1 = _bigram_codes(s1.lower())
+        grams2 = _bigram_codes(s2.lower())
+        intersection = np.intersect1d(grams1, grams2, assume_unique=True).size
+        return intersection / (grams1.size + grams2.size - intersection)
+    
+    mask1 = _ngram_mask(s1, n_gram)
+    mask2 = _ngram_mask(s2, n_gram)
+    return _popcount(mask1 & mask2) / _popcount(mask1 | mask2)
+
+
+def _name_lev_cutoff(threshold: float) -> float:
+    """`name_similarity` >= threshold için gereken en düşük Levenshtein skoru."""
+    if threshold <= 0.4:
+        return 0.0
+    # Jaccard en fazla 1 olduğundan Lev >= (t - 0.4) / 0.6 gerekir; kayan
+    # nokta yuvarlamasıyla sınırdaki çiftleri elememek için küçük pay bırakılır
+    return (threshold - 0.4) / 0.6 - 1e-9
 
 
-def name_similarity(name1: str, name2: str) -> float:
+def name_similarity(name1: str, name2: str, threshold: float = 0.0) -> float:
     """
     İsim benzerliği hesaplar (Levenshtein + Jaccard hibrit).
     
+    Skor simetriktir; (a, b) ve (b, a) aynı cache girdisini paylaşır.
+    
     Parametreler:
         name1: İlk isim.
         name2: İkinci isim.
+        threshold: Bu değerin altındaki skorlar 0.0 döner. Levenshtein
+            skoru eşiğe ulaşmaya yetmiyorsa Jaccard hesaplanmaz.
     
     Dönen:
         Hibrit benzerlik skoru (0-1 arası).
@@ -112,12 +498,106 @@ def name_similarity(name1: str, name2: str) -> float:
     if not name1 or not name2:
         return 0.0
     
+    if name2 < name1:
+        name1, name2 = name2, name1
+    return _name_similarity(name1, name2, threshold)
+
+
+@lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def _name_similarity(name1: str, name2: str, threshold: float) -> float:
+    """`name_similarity` çekirdeği; sıralı isim çifti başına bir kez hesaplanır."""
     # Her iki yöntemi de kullan ve ortalamasını al
-    lev_sim = levenshtein_similarity(name1, name2)
+    lev_cutoff = _name_lev_cutoff(threshold)
+    lev_sim = levenshtein_similarity(name1, name2, lev_cutoff)
+    if lev_cutoff and lev_sim < lev_cutoff:
+        return 0.0
     jac_sim = jaccard_similarity(name1, name2)
     
     # Ağırlıklı ortalama (Levenshtein daha önemli)
-    return (lev_sim * 0.6 + jac_sim * 0.4)
+    similarity = lev_sim * 0.6 + jac_sim * 0.4
+    return similarity if similarity >= threshold else 0.0
+
+
+def name_similarity_batch(
+    query: str, candidates: Sequence[str], threshold: float = 0.0
+) -> List[float]:
+    """
+    Bir ismi aday isim listesinin tamamıyla karşılaştırır.
+    
+    rapidfuzz kuruluysa Levenshtein skorları tek bir `cdist` çağrısıyla
+    hesaplanır; sonuçlar `name_similarity` ile birebir aynıdır.
+    
+    Parametreler:
+        query: Aranan isim.
+        candidates: Karşılaştırılacak isimler.
+        threshold: Bu değerin altındaki skorlar 0.0 döner.
+    
+    Dönen:
+        Her aday için hibrit benzerlik skoru (0-1 arası), aynı sırada.
+    """
+    return name_similarity_matrix([query], candidates, threshold)[0]
+
+
+def name_similarity_matrix(
+    queries: Sequence[str], candidates: Sequence[str], threshold: float = 0.0
+) -> List[List[float]]:
+    """
+    Birden çok ismi aday isim listesiyle karşılaştırır (sorgu x aday matrisi).
+    
+    rapidfuzz kuruluysa tüm Levenshtein skorları tek bir çok iş parçacıklı
+    `cdist` çağrısıyla hesaplanır; sonuçlar `name_similarity` ile birebir
+    aynıdır.
+    
+    Parametreler:
+        queries: Aranan isimler.
+        candidates: Karşılaştırılacak isimler.
+        threshold: Bu değerin altındaki skorlar 0.0 döner.
+    
+    Dönen:
+        Her sorgu için, adaylarla aynı sırada hibrit benzerlik skorları.
+    """
+    if not RAPIDFUZZ_AVAILABLE:
+        return [
+            [name_similarity(query, candidate, threshold) for candidate in candidates] if query
+            else [0.0] * len(candidates)
+            for query in queries
+        ]
+    
+    candidates = list(candidates)
+    lev_cutoff = _name_lev_cutoff(threshold)
+    present = [query for query in queries if query]
+    rows = iter(
+        rf_process.cdist(
+            present,
+            candidates,
+            scorer=RFLevenshtein.normalized_similarity,
+            dtype=float,
+            score_cutoff=lev_cutoff or None,
+            workers=-1 if len(present) > 1 else 1,
+        ) if present and candidates else [[]] * len(present)
+    )
+    
+    # Jaccard için n-gram maskeleri satır/sütun başına bir kez çıkarılır;
+    # kesir `jaccard_similarity` ile aynı tamsayılardan hesaplanır
+    candidate_masks = [_ngram_mask(candidate) if candidate else None for candidate in candidates]
+    
+    matrix = []
+    for query in queries:
+        if not query:
+            matrix.append([0.0] * len(candidates))
+            continue
+        query_mask = _ngram_mask(query)
+        row = []
+        for mask, lev_sim in zip(candidate_masks, next(rows)):
+            # Eşik altında kalan Levenshtein skorları cdist'te 0'lanır
+            if mask is None or (lev_cutoff and lev_sim < lev_cutoff):
+                row.append(0.0)
+                continue
+            jac_sim = _popcount(query_mask & mask) / _popcount(query_mask | mask)
+            similarity = float(lev_sim) * 0.6 + jac_sim * 0.4
+            row.append(similarity if similarity >= threshold else 0.0)
+        matrix.append(row)
+    return matrix
 
 
 def extract_address_keywords(address: str) -> List[str]:
@@ -133,34 +613,28 @@ def extract_address_keywords(address: str) -> List[str]:
     if not address:
         return []
     
-    import re
+    return list(_address_keywords(address))
+
+
+@lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def _address_keywords(address: str) -> FrozenSet[str]:
+    """`extract_address_keywords` çekirdeği; adres başına bir kez hesaplanır."""
     keywords = []
-    address_upper = address.upper()
-    
     # Türkçe karakter normalizasyonu (matching için)
-    turkish_chars = {
-        "İ": "I", "Ş": "S", "Ğ": "G", "Ü": "U", "Ö": "O", "Ç": "C",
-        "ı": "I", "ş": "S", "ğ": "G", "ü": "U", "ö": "O", "ç": "C",
-    }
-    for tr_char, en_char in turkish_chars.items():
-        address_upper = address_upper.replace(tr_char, en_char)
+    address_upper = address.upper().translate(_TR_FOLD)
     
     # OCR hataları düzelt (isim için)
     # "M0DA" -> "MODA", "K1RA" -> "KIRA"
-    address_upper = re.sub(r'([A-Z])0([A-Z])', r'\1O\2', address_upper)
-    address_upper = re.sub(r'([A-Z])1([A-Z])', r'\1I\2', address_upper)
+    address_upper = _OCR_ZERO_RE.sub(r'\1O\2', address_upper)
+    address_upper = _OCR_ONE_RE.sub(r'\1I\2', address_upper)
     
     # 1. Mahalle/Sokak/Cadde adlarını yakala (kelime bazında)
     # "BEŞİKTAŞ SİNANPAŞA MAH" -> ["BESIKTAS", "SINANPASA"]
     # "Sinanpaşa Mahallesi" -> ["SINANPASA"]
-    mah_patterns = [
-        r"(\w+(?:\s+\w+)?)\s+MAH(?:ALLE)?(?:SI)?[\.]?",  # SİNANPAŞA MAH, MODA MAHALLESI
-        r"(\w+)\s+SOK(?:AK)?[\.]?",  # BESTEKAR SOKAK
-        r"(\w+)\s+CAD(?:DESI)?[\.]?",  # DENİZ CADDESİ
-    ]
-    
-    for pattern in mah_patterns:
-        matches = re.findall(pattern, address_upper)
+    for suffix, pattern in _MAH_PATTERNS:
+        if suffix not in address_upper:
+            continue
+        matches = pattern.findall(address_upper)
         for match in matches:
             # Her kelimeyi ayrı keyword yap
             for word in match.split():
@@ -170,31 +644,19 @@ def extract_address_keywords(address: str) -> List[str]:
     # 2. Genel mahalle/semt isimleri (pattern olmadan)
     # "MODA", "MECIDIYEKOY", "BESIKTAS" gibi büyük harfli kelimeler
     # Ama sadece adres-benzeri context'te (stopwords değil)
-    stopwords = {"KIRA", "RENT", "KASIM", "ARALIK", "OCAK", "SUBAT", "MART", 
-                 "NISAN", "MAYIS", "HAZIRAN", "TEMMUZ", "AGUSTOS", "EYLUL", 
-                 "EKIM", "TL", "TRY", "USD", "EUR", "FAST", "MESAJ", "HAVALE"}
-    
     # 3-10 harf arası kelimeleri al (çok kısa veya çok uzun olmasın)
-    words = re.findall(r'\b([A-Z]{3,15})\b', address_upper)
+    words = _WORD_RE.findall(address_upper)
     for word in words:
-        if word not in stopwords and not word.isdigit():
+        if word not in _STOPWORDS and not word.isdigit():
             keywords.append(word)
     
     # 3. Daire/Kat/No numaralarını yakala
     # "DAİRE:8", "Daire:12", "No:15" -> "DAIRE_8", "DAIRE_12", "NO_15"
-    num_patterns = [
-        (r"DAIRE[:\s]*([0-9]+)", "DAIRE"),
-        (r"KAT[:\s]*([0-9]+)", "KAT"),
-        (r"NO[:\s]*([0-9]+)", "NO"),
-    ]
-    
-    for pattern, prefix in num_patterns:
-        matches = re.findall(pattern, address_upper)
-        for num in matches:
-            keywords.append(f"{prefix}_{num}")
+    for prefix, num in _NUM_RE.findall(address_upper):
+        keywords.append(f"{prefix}_{num}")
     
     # 4. Deduplicate
-    return list(set(keywords))
+    return frozenset(keywords)
 
 
 def address_similarity(address1: str, address2: str) -> float:
@@ -211,12 +673,35 @@ def address_similarity(address1: str, address2: str) -> float:
     if not address1 or not address2:
         return 0.0
     
-    keywords1 = set(extract_address_keywords(address1))
-    keywords2 = set(extract_address_keywords(address2))
+    return address_similarity_precomputed(address1, address2, _address_keywords(address2))
+
+
+def address_similarity_precomputed(
+    address: str, candidate_address: str, candidate_keywords: FrozenSet[str]
+) -> float:
+    """
+    `address_similarity`'nin aday tarafı önceden hesaplanmış hali.
+    
+    Aday adreslerin keyword'leri veri yüklenirken bir kez çıkarılır;
+    burada yalnızca OCR adresinin keyword'leri çıkarılır.
+    
+    Parametreler:
+        address: OCR'dan gelen adres/açıklama.
+        candidate_address: Aday kaydın adresi.
+        candidate_keywords: `extract_address_keywords(candidate_address)` kümesi.
+    
+    Dönen:
+        Benzerlik skoru (0-1 arası).
+    """
+    if not address or not candidate_address:
+        return 0.0
+    
+    keywords1 = _address_keywords(address)
+    keywords2 = candidate_keywords
     
     if not keywords1 and not keywords2:
         # Keyword yoksa, genel Levenshtein kullan
-        return levenshtein_similarity(address1, address2)
+        return levenshtein_similarity(address, candidate_address)
     
     if not keywords1 or not keywords2:
         return 0.0
@@ -231,12 +716,29 @@ def address_similarity(address1: str, address2: str) -> float:
     return intersection / union
 
 
+def clear_caches() -> None:
+    """Benzerlik ve keyword memoization cache'lerini temizler."""
+    levenshtein_similarity.cache_clear()
+    jaccard_similarity.cache_clear()
+    _name_similarity.cache_clear()
+    ngram_set.cache_clear()
+    _ngram_mask.cache_clear()
+    with _NGRAM_BITS_LOCK:
+        _NGRAM_BITS.clear()
+    _address_keywords.cache_clear()
+
+
 __all__ = [
     "levenshtein_distance",
     "levenshtein_similarity",
     "jaccard_similarity",
+    "ngram_set",
     "name_similarity",
+    "name_similarity_batch",
+    "name_similarity_matrix",
     "address_similarity",
+    "address_similarity_precomputed",
     "extract_address_keywords",
+    "clear_caches",
 ]
 
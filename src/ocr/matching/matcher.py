@@ -8,10 +8,27 @@ Mock data'daki öncelik sırasına göre implement edilmiştir.
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
-from .fuzzy import address_similarity, name_similarity
+# Çok adaylı tutar karşılaştırması için vektörleştirme (opsiyonel bağımlılık)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .fuzzy import (
+    RAPIDFUZZ_AVAILABLE,
+    address_similarity,
+    address_similarity_precomputed,
+    extract_address_keywords,
+    name_similarity,
+    name_similarity_batch,
+    name_similarity_matrix,
+    ngram_set,
+)
 from .normalizers import normalize_amount, normalize_iban, normalize_name
 
 
@@ -42,6 +59,16 @@ class ReceiptMatchResult:
     messages: List[str] = field(default_factory=list)
 
 
+class _CriterionScores(NamedTuple):
+    """Bir adayın kriter skorları (MATCHING_CRITERIA sırasıyla, 0-1 arası)."""
+    
+    iban: float
+    amount: float
+    name: float
+    address: float
+    sender: float
+
+
 # Ağırlık sistemi (toplam: 100)
 MATCHING_CRITERIA = {
     "iban": {"priority": 1, "weight": 35, "threshold": 0.95},      # En kritik: IBAN eşleşmesi
@@ -51,6 +78,21 @@ MATCHING_CRITERIA = {
     "sender": {"priority": 5, "weight": 5, "threshold": 0.60},     # Gönderen bilgisi
 }
 
+# Kriter ağırlıkları modül yüklenirken sabitlenir (aday başına sözlük araması
+# yapılmaz); MATCHING_CRITERIA çalışma anında değiştirilirse modül yeniden
+# yüklenmeli
+_IBAN_WEIGHT, _AMOUNT_WEIGHT, _NAME_WEIGHT, _ADDRESS_WEIGHT, _SENDER_WEIGHT = (
+    MATCHING_CRITERIA[criterion]["weight"]
+    for criterion in ("iban", "amount", "name", "address", "sender")
+)
+_TOTAL_WEIGHT = float(sum(criterion["weight"] for criterion in MATCHING_CRITERIA.values()))
+
+# İsim benzerliğiyle aday sayılmak için gereken en düşük skor
+NAME_CANDIDATE_THRESHOLD = 0.7
+
+# Bu sayıdan az adayda tutar skorları Python döngüsüyle daha hızlı
+NUMPY_AMOUNT_MIN_CANDIDATES = 512
+
 
 def match_receipt(
     ocr_data: Dict[str, Any],
@@ -58,6 +100,17 @@ def match_receipt(
     customers: List[Dict[str, Any]],
     properties: List[Dict[str, Any]],
     min_confidence: float = 70.0,
+    iban_index: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    address_index: Optional[Dict[str, FrozenSet[str]]] = None,
+    name_index: Optional[Dict[str, str]] = None,
+    bigram_index: Optional[Dict[str, FrozenSet[str]]] = None,
+    owner_name_index: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    property_index: Optional[Dict[Any, List[Dict[str, Any]]]] = None,
+    owner_names: Optional[Sequence[str]] = None,
+    customer_names: Optional[Sequence[str]] = None,
+    normalized_ibans: Optional[Dict[str, str]] = None,
+    owner_similarities: Optional[Sequence[float]] = None,
+    customer_similarities: Optional[Sequence[float]] = None,
 ) -> ReceiptMatchResult:
     """
     OCR çıktısını database kayıtlarıyla eşleştirir.
@@ -69,12 +122,45 @@ def match_receipt(
     4. Adres bilgisi (güven: 70)
     5. Gönderen bilgisi (güven: 60)
     
+    Alıcı IBAN'ı bir sahibin IBAN'ıyla birebir eşleşirse yalnızca o
+    sahibin kayıtları puanlanır; isim benzerliği taraması yapılmaz. IBAN
+    eşleşmezse ve normalize alıcı ismi bir sahibin ismiyle birebir aynıysa
+    (ve o sahibin mülkü varsa) yine tarama yapılmaz.
+    
     Parametreler:
         ocr_data: OCR'dan çıkarılan veri (extract_fields çıktısı).
         owners: Mülk sahipleri listesi.
         customers: Müşteriler listesi.
         properties: Mülkler listesi.
         min_confidence: Minimum güven skoru (varsayılan: 70).
+        iban_index: `build_iban_index(owners)` çıktısı. Aynı sahip listesiyle
+            çok sayıda dekont eşleştirilecekse bir kez hesaplanıp verilmeli;
+            verilmezse her çağrıda yeniden oluşturulur.
+        address_index: `build_address_index(properties)` çıktısı. Verilirse
+            mülk adreslerinin keyword'leri yeniden çıkarılmaz.
+        name_index: `build_name_index(owners + customers)` çıktısı. Verilirse
+            sahip ve müşteri isimleri yeniden normalize edilmez.
+        bigram_index: Normalize sahip isimleri üzerinde `build_bigram_index`
+            çıktısı. Verilirse isim benzerliği yalnızca yeterince ortak
+            bigram'ı olan sahipler için hesaplanır.
+        owner_name_index: `build_owner_name_index(owners)` çıktısı;
+            verilmezse her çağrıda yeniden oluşturulur.
+        property_index: `build_property_index(properties)` çıktısı;
+            verilmezse her çağrıda yeniden oluşturulur.
+        owner_names: `owners` ile aynı sıradaki normalize sahip isimleri
+            (`prepare_matching_db` hazırlar); verilmezse her çağrıda
+            `name_index`'ten toplanır.
+        customer_names: `customers` ile aynı sıradaki normalize müşteri
+            isimleri.
+        normalized_ibans: `build_normalized_iban_index(owners)` çıktısı.
+            Verilirse aday sahiplerin IBAN'ları yeniden normalize edilmez.
+        owner_similarities: Alıcı isminin `owners` ile aynı sıradaki
+            `name_similarity` skorları (`match_receipts` toplu hesaplar).
+        customer_similarities: Gönderen isminin `customers` ile aynı
+            sıradaki `name_similarity` skorları.
+    
+    İndeksler birlikte `prepare_matching_db(owners, customers, properties)`
+    ile hazırlanıp `match_receipt(..., **prepared)` şeklinde verilebilir.
     
     Dönen:
         ReceiptMatchResult objesi.
@@ -82,68 +168,113 @@ def match_receipt(
     result = ReceiptMatchResult()
     result.matching_details = {
         "ocr_data": ocr_data,
-        "criteria_scores": {},
+        "criteria_scores": [],
         "candidates": [],
     }
     
     # OCR verilerini normalize et
     receiver_iban = normalize_iban(ocr_data.get("receiver_account") or ocr_data.get("receiver_iban", ""))
-    receiver_name = normalize_name(ocr_data.get("receiver_name") or ocr_data.get("recipient", ""))
-    sender_name = normalize_name(ocr_data.get("sender_name") or ocr_data.get("sender", ""))
+    receiver_name, sender_name = _receipt_names(ocr_data)
     amount = normalize_amount(ocr_data.get("amount_text") or ocr_data.get("amount", ""))
     description = ocr_data.get("description", "")
     
-    # Aday kayıtları bul
-    candidates = _find_candidates(
-        receiver_iban=receiver_iban,
-        receiver_name=receiver_name,
-        amount=amount,
-        description=description,
-        owners=owners,
-        properties=properties,
-    )
+    # Aday kayıtları bul: önce birebir IBAN, sonra birebir isim, yoksa
+    # isim benzerliği
+    if iban_index is None:
+        iban_index = build_iban_index(owners)
+    if owner_name_index is None:
+        owner_name_index = build_owner_name_index(owners, name_index)
+    if property_index is None:
+        property_index = build_property_index(properties)
+    iban_owners = iban_index.get(receiver_iban) if receiver_iban else None
+    name_owners = owner_name_index.get(receiver_name) if receiver_name else None
+    candidates = []
+    if iban_owners:
+        candidates = _iban_candidates(iban_owners, property_index)
+    elif name_owners:
+        candidates = _find_candidates(
+            receiver_iban=receiver_iban,
+            receiver_name=receiver_name,
+            amount=amount,
+            description=description,
+            owners=name_owners,
+            property_index=property_index,
+            similarities=[1.0] * len(name_owners),
+        )
+    if not candidates and not iban_owners:
+        candidates = _find_candidates(
+            receiver_iban=receiver_iban,
+            receiver_name=receiver_name,
+            amount=amount,
+            description=description,
+            owners=owners,
+            property_index=property_index,
+            name_index=name_index,
+            bigram_index=bigram_index,
+            owner_names=owner_names,
+            similarities=owner_similarities,
+        )
     
     if not candidates:
         result.messages.append("Eşleşen kayıt bulunamadı")
         result.match_status = "manual_review"
         return result
     
+    # Gönderen skoru adaydan bağımsızdır; müşteri taraması bir kez yapılır
+    sender_score, sender_customer_id = _best_customer(
+        sender_name,
+        customers,
+        name_index,
+        customer_names=customer_names,
+        similarities=customer_similarities,
+    )
+    
+    # Tutar skorları tüm adaylar için tek seferde
+    amount_scores = _amount_scores(amount, [candidate.get("property") for candidate in candidates])
+    
     # En iyi eşleşmeyi bul
     best_match = None
+    best_scores = None
     best_score = 0.0
     
-    for candidate in candidates:
-        scores = _calculate_match_scores(
-            ocr_data=ocr_data,
+    criteria_scores = result.matching_details["criteria_scores"]
+    for candidate_index, (candidate, amount_score) in enumerate(zip(candidates, amount_scores)):
+        criterion_scores = _calculate_match_scores(
             receiver_iban=receiver_iban,
             receiver_name=receiver_name,
-            sender_name=sender_name,
             amount=amount,
             description=description,
             owner=candidate["owner"],
             property_obj=candidate.get("property"),
-            customers=customers,
+            amount_score=amount_score,
+            sender_score=sender_score,
+            address_index=address_index,
+            name_index=name_index,
+            normalized_ibans=normalized_ibans,
         )
         
         # Toplam güven skorunu hesapla
-        total_score = _calculate_total_confidence(scores)
+        total_score = _calculate_total_confidence(criterion_scores)
+        scores = criterion_scores._asdict()
         candidate["total_score"] = total_score
         candidate["scores"] = scores
         # Customer ID'yi candidate'a ekle
-        if "_customer_id" in scores:
-            candidate["customer_id"] = scores["_customer_id"]
+        if sender_customer_id is not None:
+            candidate["customer_id"] = sender_customer_id
         
         if total_score > best_score:
             best_score = total_score
             best_match = candidate
+            best_scores = criterion_scores
         
         # Debug: skorları kaydet
-        result.matching_details["criteria_scores"][f"candidate_{len(result.matching_details.get('candidates', []))}"] = {
+        criteria_scores.append({
+            "candidate_index": candidate_index,
             "owner_id": candidate["owner"]["id"],
             "property_id": candidate.get("property", {}).get("id"),
             "scores": scores,
             "total_score": total_score,
-        }
+        })
     
     # Güven skoru 0-100 arası olmalı
     best_score_percent = best_score  # Zaten 0-100 arası hesaplanıyor
@@ -156,12 +287,11 @@ def match_receipt(
         result.confidence_score = best_score_percent
         
         # Skorları kaydet
-        scores = best_match.get("scores", {})
-        result.iban_match_score = scores.get("iban", 0.0)
-        result.amount_match_score = scores.get("amount", 0.0)
-        result.name_match_score = scores.get("name", 0.0)
-        result.address_match_score = scores.get("address", 0.0)
-        result.sender_match_score = scores.get("sender", 0.0)
+        result.iban_match_score = best_scores.iban
+        result.amount_match_score = best_scores.amount
+        result.name_match_score = best_scores.name
+        result.address_match_score = best_scores.address
+        result.sender_match_score = best_scores.sender
         
         result.matching_details["best_match"] = best_match
         result.matching_details["all_candidates"] = candidates
@@ -182,12 +312,11 @@ def match_receipt(
             result.confidence_score = best_score_percent
             
             # Skorları kaydet
-            scores = best_match.get("scores", {})
-            result.iban_match_score = scores.get("iban", 0.0)
-            result.amount_match_score = scores.get("amount", 0.0)
-            result.name_match_score = scores.get("name", 0.0)
-            result.address_match_score = scores.get("address", 0.0)
-            result.sender_match_score = scores.get("sender", 0.0)
+            result.iban_match_score = best_scores.iban
+            result.amount_match_score = best_scores.amount
+            result.name_match_score = best_scores.name
+            result.address_match_score = best_scores.address
+            result.sender_match_score = best_scores.sender
             
             result.messages.append(f"Düşük güven skoru (skor: {best_score_percent:.1f}/100), manuel inceleme gerekli")
         else:
@@ -196,158 +325,561 @@ def match_receipt(
     return result
 
 
+def match_receipts(
+    ocr_batch: Sequence[Dict[str, Any]],
+    owners: List[Dict[str, Any]],
+    customers: List[Dict[str, Any]],
+    properties: List[Dict[str, Any]],
+    min_confidence: float = 70.0,
+    iban_index: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    address_index: Optional[Dict[str, FrozenSet[str]]] = None,
+    name_index: Optional[Dict[str, str]] = None,
+    bigram_index: Optional[Dict[str, FrozenSet[str]]] = None,
+    owner_name_index: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    property_index: Optional[Dict[Any, List[Dict[str, Any]]]] = None,
+    owner_names: Optional[Sequence[str]] = None,
+    customer_names: Optional[Sequence[str]] = None,
+    normalized_ibans: Optional[Dict[str, str]] = None,
+) -> List[ReceiptMatchResult]:
+    """
+    Birden çok dekontu aynı database kayıtlarıyla eşleştirir.
+    
+    Alıcı isimleri x sahipler ve gönderen isimleri x müşteriler benzerlik
+    matrisleri rapidfuzz kuruluysa `name_similarity_matrix` ile toplu
+    hesaplanır; her dekont sonra `match_receipt` ile puanlanır. Sonuçlar
+    tek tek `match_receipt` çağrılarıyla aynıdır.
+    
+    Parametreler:
+        ocr_batch: OCR'dan çıkarılan veriler (extract_fields çıktıları).
+        owners: Mülk sahipleri listesi.
+        customers: Müşteriler listesi.
+        properties: Mülkler listesi.
+        min_confidence: Minimum güven skoru (varsayılan: 70).
+        iban_index, address_index, name_index, bigram_index, owner_name_index,
+        property_index, owner_names, customer_names, normalized_ibans:
+            `prepare_matching_db`
+            çıktısı (bkz. `match_receipt`).
+    
+    Dönen:
+        Her dekont için ReceiptMatchResult, aynı sırada.
+    """
+    if iban_index is None:
+        iban_index = build_iban_index(owners)
+    if name_index is None:
+        name_index = build_name_index(owners + customers)
+    if normalized_ibans is None:
+        normalized_ibans = build_normalized_iban_index(owners)
+    if owner_name_index is None:
+        owner_name_index = build_owner_name_index(owners, name_index)
+    if property_index is None:
+        property_index = build_property_index(properties)
+    if owner_names is None:
+        owner_names = [_normalized_name(owner, name_index) for owner in owners]
+    if customer_names is None:
+        customer_names = [_normalized_name(customer, name_index) for customer in customers]
+    
+    if not RAPIDFUZZ_AVAILABLE:
+        # Saf Python'da tam matris, bigram elemesinden pahalıdır
+        return [
+            match_receipt(
+                ocr_data,
+                owners,
+                customers,
+                properties,
+                min_confidence=min_confidence,
+                iban_index=iban_index,
+                address_index=address_index,
+                name_index=name_index,
+                bigram_index=bigram_index,
+                owner_name_index=owner_name_index,
+                property_index=property_index,
+                owner_names=owner_names,
+                customer_names=customer_names,
+                normalized_ibans=normalized_ibans,
+            )
+            for ocr_data in ocr_batch
+        ]
+    
+    names = [_receipt_names(ocr_data) for ocr_data in ocr_batch]
+    
+    # Birebir IBAN veya isim eşleşen dekontlarda sahip isimleri taranmaz
+    # (isim eşleşmesi mülksüz sahiplere düşerse match_receipt kendisi tarar)
+    name_rows = []
+    for ocr_data, (receiver_name, _) in zip(ocr_batch, names):
+        receiver_iban = normalize_iban(ocr_data.get("receiver_account") or ocr_data.get("receiver_iban", ""))
+        if (
+            receiver_name
+            and receiver_name not in owner_name_index
+            and not (receiver_iban and receiver_iban in iban_index)
+        ):
+            name_rows.append(receiver_name)
+    name_rows = list(dict.fromkeys(name_rows))
+    owner_matrix = dict(zip(
+        name_rows,
+        name_similarity_matrix(name_rows, owner_names, threshold=NAME_CANDIDATE_THRESHOLD),
+    ))
+    
+    sender_names = [sender_name for _, sender_name in names]
+    customer_matrix = name_similarity_matrix(sender_names, customer_names)
+    
+    return [
+        match_receipt(
+            ocr_data,
+            owners,
+            customers,
+            properties,
+            min_confidence=min_confidence,
+            iban_index=iban_index,
+            address_index=address_index,
+            name_index=name_index,
+            owner_name_index=owner_name_index,
+            property_index=property_index,
+            owner_names=owner_names,
+            customer_names=customer_names,
+            normalized_ibans=normalized_ibans,
+            owner_similarities=owner_matrix.get(receiver_name),
+            customer_similarities=customer_row,
+        )
+        for ocr_data, (receiver_name, _), customer_row in zip(ocr_batch, names, customer_matrix)
+    ]
+
+
+def build_iban_index(owners: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Sahipleri normalize edilmiş IBAN'larına göre gruplar.
+    
+    Parametreler:
+        owners: Mülk sahipleri listesi.
+    
+    Dönen:
+        Normalize IBAN -> o IBAN'a sahip sahipler (liste sırasıyla).
+    """
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for owner in owners:
+        owner_iban = normalize_iban(owner.get("iban", ""))
+        if owner_iban:
+            index.setdefault(owner_iban, []).append(owner)
+    return index
+
+
+def build_normalized_iban_index(owners: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Sahiplerin `iban` alanlarını bir kez normalize eder.
+    
+    Parametreler:
+        owners: Mülk sahipleri listesi.
+    
+    Dönen:
+        Ham IBAN -> `normalize_iban` çıktısı.
+    """
+    index: Dict[str, str] = {}
+    for owner in owners:
+        owner_iban = owner.get("iban", "")
+        if owner_iban and owner_iban not in index:
+            index[owner_iban] = normalize_iban(owner_iban)
+    return index
+
+
+def build_owner_name_index(
+    owners: List[Dict[str, Any]],
+    name_index: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Sahipleri normalize edilmiş isimlerine göre gruplar.
+    
+    Parametreler:
+        owners: Mülk sahipleri listesi.
+        name_index: Varsa `build_name_index` çıktısı.
+    
+    Dönen:
+        Normalize isim -> o isme sahip sahipler (liste sırasıyla).
+    """
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for owner in owners:
+        owner_name = _normalized_name(owner, name_index)
+        if owner_name:
+            index.setdefault(owner_name, []).append(owner)
+    return index
+
+
+def build_property_index(properties: List[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+    """
+    Mülkleri sahiplerine (`owner_id`) göre gruplar.
+    
+    Parametreler:
+        properties: Mülkler listesi.
+    
+    Dönen:
+        owner_id -> o sahibin mülkleri (liste sırasıyla).
+    """
+    index: Dict[Any, List[Dict[str, Any]]] = {}
+    for prop in properties:
+        index.setdefault(prop.get("owner_id"), []).append(prop)
+    return index
+
+
+def build_address_index(properties: List[Dict[str, Any]]) -> Dict[str, FrozenSet[str]]:
+    """
+    Mülk adreslerinin keyword kümelerini bir kez hesaplar.
+    
+    Parametreler:
+        properties: Mülkler listesi.
+    
+    Dönen:
+        Adres -> `extract_address_keywords` kümesi.
+    """
+    index: Dict[str, FrozenSet[str]] = {}
+    for prop in properties:
+        address = prop.get("address", "")
+        if address and address not in index:
+            index[address] = frozenset(extract_address_keywords(address))
+    return index
+
+
+def build_name_index(records: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Kayıtların `full_name` alanlarını bir kez normalize eder.
+    
+    Parametreler:
+        records: `full_name` alanı olan kayıtlar (sahipler, müşteriler).
+    
+    Dönen:
+        Ham isim -> `normalize_name` çıktısı.
+    """
+    index: Dict[str, str] = {}
+    for record in records:
+        full_name = record.get("full_name", "")
+        if full_name and full_name not in index:
+            index[full_name] = normalize_name(full_name)
+    return index
+
+
+def build_bigram_index(names: Iterable[str]) -> Dict[str, FrozenSet[str]]:
+    """
+    Normalize isimler üzerinde bigram -> isimler ters indeksini oluşturur.
+    
+    Parametreler:
+        names: Normalize edilmiş isimler.
+    
+    Dönen:
+        `ngram_set` bigram'ı -> o bigram'ı içeren isimler.
+    """
+    index: Dict[str, set] = {}
+    for name in names:
+        if name:
+            for gram in ngram_set(name):
+                index.setdefault(gram, set()).add(name)
+    return {gram: frozenset(gram_names) for gram, gram_names in index.items()}
+
+
+def prepare_matching_db(
+    owners: List[Dict[str, Any]],
+    customers: List[Dict[str, Any]],
+    properties: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    `match_receipt` için veritabanı indekslerini bir kez hazırlar.
+    
+    Kayıtların kendisine alan eklenmez (matching_details'e aynen yazılırlar);
+    normalize değerler yan indekslerde tutulur.
+    
+    Parametreler:
+        owners: Mülk sahipleri listesi.
+        customers: Müşteriler listesi.
+        properties: Mülkler listesi.
+    
+    Dönen:
+        `match_receipt`'e keyword argüman olarak verilecek sözlük
+        (iban_index, address_index, name_index, bigram_index,
+        owner_name_index, property_index, owner_names, customer_names,
+        normalized_ibans).
+    """
+    name_index = build_name_index(owners + customers)
+    # Normalize isim sütunları kayıt listeleriyle aynı sıradadır
+    owner_names = tuple(_normalized_name(owner, name_index) for owner in owners)
+    customer_names = tuple(_normalized_name(customer, name_index) for customer in customers)
+    return {
+        "iban_index": build_iban_index(owners),
+        "owner_name_index": build_owner_name_index(owners, name_index),
+        "property_index": build_property_index(properties),
+        "address_index": build_address_index(properties),
+        "name_index": name_index,
+        "bigram_index": build_bigram_index(owner_names),
+        "owner_names": owner_names,
+        "customer_names": customer_names,
+        "normalized_ibans": build_normalized_iban_index(owners),
+    }
+
+
+def _receipt_names(ocr_data: Dict[str, Any]) -> Tuple[str, str]:
+    """OCR verisinden normalize (alıcı, gönderen) isimlerini çıkarır."""
+    receiver_name = normalize_name(ocr_data.get("receiver_name") or ocr_data.get("recipient", ""))
+    sender_name = normalize_name(ocr_data.get("sender_name") or ocr_data.get("sender", ""))
+    return receiver_name, sender_name
+
+
+def _normalized_name(record: Dict[str, Any], name_index: Optional[Dict[str, str]]) -> str:
+    """Kaydın normalize ismini indeksten, yoksa hesaplayarak döndürür."""
+    full_name = record.get("full_name", "")
+    if name_index is not None:
+        cached = name_index.get(full_name)
+        if cached is not None:
+            return cached
+    return normalize_name(full_name)
+
+
+def _normalized_iban(owner: Dict[str, Any], normalized_ibans: Optional[Dict[str, str]]) -> str:
+    """Sahibin normalize IBAN'ını indeksten, yoksa hesaplayarak döndürür."""
+    owner_iban = owner.get("iban", "")
+    if normalized_ibans is not None:
+        cached = normalized_ibans.get(owner_iban)
+        if cached is not None:
+            return cached
+    return normalize_iban(owner_iban)
+
+
+def _best_customer(
+    sender_name: str,
+    customers: List[Dict[str, Any]],
+    name_index: Optional[Dict[str, str]] = None,
+    customer_names: Optional[Sequence[str]] = None,
+    similarities: Optional[Sequence[float]] = None,
+) -> Tuple[float, Optional[int]]:
+    """Gönderene en çok benzeyen müşterinin (skor, id) çiftini bulur."""
+    best_score = 0.0
+    best_customer_id = None
+    if sender_name:
+        if similarities is None:
+            if customer_names is None:
+                customer_names = [_normalized_name(customer, name_index) for customer in customers]
+            similarities = name_similarity_batch(sender_name, customer_names)
+        # Boş isimlerin benzerliği 0.0 olduğundan seçilmezler
+        for customer, similarity in zip(customers, similarities):
+            if similarity > best_score:
+                best_score = similarity
+                best_customer_id = customer.get("id")
+    return best_score, best_customer_id
+
+
+def _iban_candidates(
+    owners: List[Dict[str, Any]],
+    property_index: Dict[Any, List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """IBAN'ı birebir eşleşen sahiplerin aday kayıtlarını oluşturur."""
+    candidates = []
+    
+    for owner in owners:
+        # Bu owner'a ait property'leri bul
+        owner_properties = property_index.get(owner["id"])
+        
+        if owner_properties:
+            for prop in owner_properties:
+                candidates.append({
+                    "owner": owner,
+                    "property": prop,
+                    "match_reason": "iban_exact",
+                })
+        else:
+            candidates.append({
+                "owner": owner,
+                "match_reason": "iban_exact",
+            })
+    
+    return candidates
+
+
+def _amount_score(amount: Optional[float], property_obj: Optional[Dict[str, Any]]) -> float:
+    """Tutarı mülk fiyatıyla karşılaştırır (±%5 tolerans)."""
+    if amount and property_obj:
+        property_price = property_obj.get("price")
+        if property_price:
+            # ±%5 tolerans
+            tolerance = property_price * 0.05
+            diff = abs(amount - property_price)
+            if diff <= tolerance:
+                return 1.0 - (diff / tolerance) * 0.2  # 0.8-1.0 arası
+            elif diff <= tolerance * 2:
+                return 0.5
+    return 0.0
+
+
+def _amount_scores(
+    amount: Optional[float],
+    property_objs: Sequence[Optional[Dict[str, Any]]],
+) -> List[float]:
+    """
+    `_amount_score`'u aday mülk listesinin tamamına uygular.
+    
+    Aday sayısı NUMPY_AMOUNT_MIN_CANDIDATES ve üzerindeyse fiyatlar tek bir
+    float64 dizisinde karşılaştırılır; sonuçlar skaler formülle aynıdır.
+    """
+    if not amount or not NUMPY_AVAILABLE or len(property_objs) < NUMPY_AMOUNT_MIN_CANDIDATES:
+        return [_amount_score(amount, property_obj) for property_obj in property_objs]
+    
+    prices = np.fromiter(
+        ((property_obj.get("price") or 0.0) if property_obj else 0.0 for property_obj in property_objs),
+        dtype=np.float64,
+        count=len(property_objs),
+    )
+    tolerance = prices * 0.05
+    diff = np.abs(amount - prices)
+    # Fiyatı olmayan (0) mülklerde bölme uyarısı bastırılır; skorları 0.0'a çekilir
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(
+            diff <= tolerance,
+            1.0 - (diff / tolerance) * 0.2,
+            np.where(diff <= tolerance * 2, 0.5, 0.0),
+        )
+    scores[prices == 0.0] = 0.0
+    return scores.tolist()
+
+
 def _find_candidates(
     receiver_iban: str,
     receiver_name: str,
     amount: Optional[float],
     description: str,
     owners: List[Dict[str, Any]],
-    properties: List[Dict[str, Any]],
+    property_index: Dict[Any, List[Dict[str, Any]]],
+    name_index: Optional[Dict[str, str]] = None,
+    bigram_index: Optional[Dict[str, FrozenSet[str]]] = None,
+    owner_names: Optional[Sequence[str]] = None,
+    similarities: Optional[Sequence[float]] = None,
 ) -> List[Dict[str, Any]]:
-    """IBAN veya isim bazlı aday kayıtları bulur."""
+    """
+    İsim bazlı aday kayıtları bulur.
+    
+    Birebir IBAN eşleşmesi `match_receipt` içinde `_iban_candidates` ile
+    önceden ele alınır; buraya yalnızca IBAN'ı eşleşmeyen dekontlar gelir.
+    """
     candidates = []
     
-    for owner in owners:
-        owner_iban = normalize_iban(owner.get("iban", ""))
-        owner_name = normalize_name(owner.get("full_name", ""))
-        
-        # IBAN eşleşmesi varsa direkt ekle
-        if receiver_iban and owner_iban and receiver_iban == owner_iban:
-            # Bu owner'a ait property'leri bul
-            owner_properties = [p for p in properties if p.get("owner_id") == owner["id"]]
-            
-            if owner_properties:
-                for prop in owner_properties:
-                    candidates.append({
-                        "owner": owner,
-                        "property": prop,
-                        "match_reason": "iban_exact",
-                    })
-            else:
+    if not receiver_name:
+        return candidates
+    
+    if similarities is None and owner_names is None:
+        owner_names = [_normalized_name(owner, name_index) for owner in owners]
+    
+    if similarities is None and bigram_index is not None:
+        # name_similarity = 0.6·Lev + 0.4·Jaccard ≥ 0.7 için Jaccard ≥ 0.25
+        # gerekir; bu da sorgu bigram'larının en az dörtte birinin ortak
+        # olmasını gerektirir. Daha az ortak bigram'ı olan sahipler elenir.
+        query_grams = ngram_set(receiver_name)
+        hits: Counter = Counter()
+        for gram in query_grams:
+            hits.update(bigram_index.get(gram, ()))
+        min_hits = len(query_grams) / 4
+        kept = [i for i, owner_name in enumerate(owner_names) if hits[owner_name] >= min_hits]
+        owners = [owners[i] for i in kept]
+        owner_names = [owner_names[i] for i in kept]
+    
+    # İsim skorları sahip isim sütunu üzerinden tek toplu çağrıda
+    if similarities is None:
+        similarities = name_similarity_batch(
+            receiver_name, owner_names, threshold=NAME_CANDIDATE_THRESHOLD
+        )
+    
+    for owner, similarity in zip(owners, similarities):
+        # İsim benzerliği yüksekse ekle (boş isimlerin benzerliği 0.0)
+        if similarity >= NAME_CANDIDATE_THRESHOLD:
+            for prop in property_index.get(owner["id"], ()):
                 candidates.append({
                     "owner": owner,
-                    "match_reason": "iban_exact",
+                    "property": prop,
+                    "match_reason": f"name_similarity_{similarity:.2f}",
                 })
-        
-        # İsim benzerliği yüksekse ekle
-        elif receiver_name and owner_name:
-            similarity = name_similarity(receiver_name, owner_name)
-            if similarity >= 0.7:
-                owner_properties = [p for p in properties if p.get("owner_id") == owner["id"]]
-                for prop in owner_properties:
-                    candidates.append({
-                        "owner": owner,
-                        "property": prop,
-                        "match_reason": f"name_similarity_{similarity:.2f}",
-                    })
     
     return candidates
 
 
 def _calculate_match_scores(
-    ocr_data: Dict[str, Any],
     receiver_iban: str,
     receiver_name: str,
-    sender_name: str,
     amount: Optional[float],
     description: str,
     owner: Dict[str, Any],
     property_obj: Optional[Dict[str, Any]],
-    customers: List[Dict[str, Any]],
-) -> Dict[str, float]:
+    amount_score: Optional[float] = None,
+    sender_score: float = 0.0,
+    address_index: Optional[Dict[str, FrozenSet[str]]] = None,
+    name_index: Optional[Dict[str, str]] = None,
+    normalized_ibans: Optional[Dict[str, str]] = None,
+) -> _CriterionScores:
     """Her kriter için skorları hesaplar."""
-    scores = {
-        "iban": 0.0,
-        "amount": 0.0,
-        "name": 0.0,
-        "address": 0.0,
-        "sender": 0.0,
-    }
-    
     # 1. IBAN eşleşmesi
-    owner_iban = normalize_iban(owner.get("iban", ""))
+    iban_score = 0.0
+    owner_iban = _normalized_iban(owner, normalized_ibans)
     if receiver_iban and owner_iban:
         if receiver_iban == owner_iban:
-            scores["iban"] = 1.0
+            iban_score = 1.0
         else:
             # Kısmi eşleşme (son 4 hanesi gibi)
             if len(receiver_iban) >= 4 and len(owner_iban) >= 4:
                 if receiver_iban[-4:] == owner_iban[-4:]:
-                    scores["iban"] = 0.5
+                    iban_score = 0.5
     
-    # 2. Tutar eşleşmesi
-    if amount and property_obj:
-        property_price = property_obj.get("price")
-        if property_price:
-            # ±%5 tolerans
-            tolerance = property_price * 0.05
-            diff = abs(amount - property_price)
-            if diff <= tolerance:
-                scores["amount"] = 1.0 - (diff / tolerance) * 0.2  # 0.8-1.0 arası
-            elif diff <= tolerance * 2:
-                scores["amount"] = 0.5
+    # 2. Tutar eşleşmesi (`_amount_scores` ile toplu hesaplanmadıysa)
+    if amount_score is None:
+        amount_score = _amount_score(amount, property_obj)
     
     # 3. İsim benzerliği
-    owner_name = normalize_name(owner.get("full_name", ""))
+    name_score = 0.0
+    owner_name = _normalized_name(owner, name_index)
     if receiver_name and owner_name:
-        scores["name"] = name_similarity(receiver_name, owner_name)
+        name_score = name_similarity(receiver_name, owner_name)
     
     # 4. Adres bilgisi
+    address_score = 0.0
     if description and property_obj:
         property_address = property_obj.get("address", "")
         if property_address:
-            scores["address"] = address_similarity(description, property_address)
-    
-    # 5. Gönderen bilgisi (Customer eşleşmesi)
-    best_customer_id = None
-    if sender_name:
-        for customer in customers:
-            customer_name = normalize_name(customer.get("full_name", ""))
-            if customer_name:
-                similarity = name_similarity(sender_name, customer_name)
-                if similarity > scores["sender"]:
-                    scores["sender"] = similarity
-                    best_customer_id = customer.get("id")
-    
-    # Customer ID'yi scores'a ekle (result'a aktarmak için)
-    if best_customer_id is not None:
-        scores["_customer_id"] = best_customer_id
+            property_keywords = address_index.get(property_address) if address_index else None
+            if property_keywords is not None:
+                address_score = address_similarity_precomputed(
+                    description, property_address, property_keywords
+                )
+            else:
+                address_score = address_similarity(description, property_address)
     
-    # _customer_id'yi scores'tan çıkar (sadece internal kullanım için)
-    # Ama döndürmeden önce kopyala
-    return scores
+    # 5. Gönderen bilgisi (Customer eşleşmesi, `_best_customer` ile bir kez)
+    return _CriterionScores(iban_score, amount_score, name_score, address_score, sender_score)
 
 
-def _calculate_total_confidence(scores: Dict[str, float]) -> float:
+def _calculate_total_confidence(scores: _CriterionScores) -> float:
     """
     Toplam güven skorunu hesaplar (ağırlıklı ortalama).
     
     Skor 0-100 arası döner (mock data'daki gibi).
     """
-    total_weight = 0.0
-    weighted_sum = 0.0
-    
-    for criterion, score in scores.items():
-        if criterion in MATCHING_CRITERIA:
-            weight = MATCHING_CRITERIA[criterion]["weight"]
-            total_weight += weight
-            # Score 0-1 arası, weight 0-100 arası
-            # Sonuç 0-100 arası olmalı
-            weighted_sum += score * weight
-    
-    if total_weight == 0:
-        return 0.0
+    iban, amount, name, address, sender = scores
+    # Score 0-1 arası, weight 0-100 arası; kriter sırası MATCHING_CRITERIA ile aynı
+    weighted_sum = (
+        iban * _IBAN_WEIGHT
+        + amount * _AMOUNT_WEIGHT
+        + name * _NAME_WEIGHT
+        + address * _ADDRESS_WEIGHT
+        + sender * _SENDER_WEIGHT
+    )
     
     # Ağırlıklı ortalama
-    # weighted_sum: 0-385 arası (tüm kriterler maksimum)
-    # total_weight: 385 (tüm ağırlıkların toplamı)
+    # weighted_sum: 0-100 arası (tüm kriterler maksimum)
+    # _TOTAL_WEIGHT: 100 (tüm ağırlıkların toplamı)
     # Sonuç: 0-1 arası, 100 ile çarpıp 0-100 yap
-    normalized_score = weighted_sum / total_weight
+    normalized_score = weighted_sum / _TOTAL_WEIGHT
     return normalized_score * 100.0
 
 
 __all__ = [
     "match_receipt",
+    "match_receipts",
+    "build_iban_index",
+    "build_normalized_iban_index",
+    "build_owner_name_index",
+    "build_property_index",
+    "build_address_index",
+    "build_name_index",
+    "build_bigram_index",
+    "prepare_matching_db",
     "ReceiptMatchResult",
     "MATCHING_CRITERIA",
 ]
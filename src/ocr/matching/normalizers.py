@@ -10,6 +10,16 @@ import re
 from datetime import datetime
 from typing import Optional
 
+# normalize_name için derlenmiş desenler ve çeviri tablosu
+# OCR hataları: harfler arası "l" -> i, "1" -> I, "0" -> O
+_NAME_LOWER_L_RE = re.compile(r'([A-Za-z])l([A-Za-z])')
+_NAME_ONE_RE = re.compile(r'([A-Z])1([A-Z])')
+_NAME_ZERO_RE = re.compile(r'([A-Z])0([A-Z])')
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Türkçe karakterler -> ASCII (tek geçişte str.translate)
+_TR_TABLE = str.maketrans("ıİşŞğĞüÜöÖçÇ", "IISSGGUUOOCC")
+
 
 def normalize_iban(iban: Optional[str]) -> str:
     """
@@ -74,7 +84,8 @@ def normalize_name(name: Optional[str]) -> str:
     normalized = name
     
     # Harfler arası lowercase l -> i (sonra uppercase olunca I olacak)
-    normalized = re.sub(r'([A-Za-z])l([A-Za-z])', r'\1i\2', normalized)
+    if "l" in normalized:
+        normalized = _NAME_LOWER_L_RE.sub(r'\1i\2', normalized)
     
     # Büyük harfe çevir
     normalized = normalized.upper()
@@ -91,31 +102,17 @@ def normalize_name(name: Optional[str]) -> str:
     normalized = normalized.replace(" 1", " I")
     normalized = normalized.replace(" 0", " O")
     
-    # Harfler arası (IBRAHIM, OSMAN gibi)
-    normalized = re.sub(r'([A-Z])1([A-Z])', r'\1I\2', normalized)
-    normalized = re.sub(r'([A-Z])0([A-Z])', r'\1O\2', normalized)
+    # Harfler arası (IBRAHIM, OSMAN gibi); rakam yoksa desenler çalıştırılmaz
+    if "1" in normalized:
+        normalized = _NAME_ONE_RE.sub(r'\1I\2', normalized)
+    if "0" in normalized:
+        normalized = _NAME_ZERO_RE.sub(r'\1O\2', normalized)
     
     # Türkçe karakterleri normalize et
-    turkish_chars = {
-        "ı": "I",
-        "İ": "I",
-        "ş": "S",
-        "Ş": "S",
-        "ğ": "G",
-        "Ğ": "G",
-        "ü": "U",
-        "Ü": "U",
-        "ö": "O",
-        "Ö": "O",
-        "ç": "C",
-        "Ç": "C",
-    }
-    
-    for turkish, ascii_char in turkish_chars.items():
-        normalized = normalized.replace(turkish, ascii_char)
+    normalized = normalized.translate(_TR_TABLE)
     
     # Çift boşlukları tek boşluğa indir
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)
     
     # Başta/sonda boşlukları temizle
     normalized = normalized.strip()
@@ -141,6 +138,10 @@ def normalize_amount(amount_text: Optional[str]) -> Optional[float]:
     if not amount_text:
         return None
     
+    # Ayırıcısız düz tutar ("15000"): temizlenecek bir şey yok
+    if amount_text.isdecimal():
+        return float(amount_text)
+    
     # TL/TRY/₺ ifadelerini temizle
     cleaned = amount_text.replace("TL", "").replace("TRY", "").replace("₺", "").strip()
     
@@ -166,15 +167,17 @@ def normalize_amount(amount_text: Optional[str]) -> Optional[float]:
             cleaned = cleaned.replace(",", "")
     elif "," in cleaned:
         # Sadece virgül var - ondalık ayırıcı olabilir
-        if cleaned.count(",") == 1 and len(cleaned.split(",")[1]) <= 2:
+        # (tek virgül ve ardından en fazla 2 karakter; split/count kopyası yok)
+        comma_pos = cleaned.find(",")
+        if comma_pos == cleaned.rfind(",") and len(cleaned) - comma_pos <= 3:
             cleaned = cleaned.replace(",", ".")
         else:
             # Binlik ayırıcı
             cleaned = cleaned.replace(",", "")
     elif "." in cleaned:
         # Sadece nokta var
-        parts = cleaned.split(".")
-        if len(parts) == 2 and len(parts[1]) <= 2:
+        dot_pos = cleaned.find(".")
+        if dot_pos == cleaned.rfind(".") and len(cleaned) - dot_pos <= 3:
             # Ondalık ayırıcı
             pass
         else:
@@ -4,9 +4,18 @@ Full Receipt Processing Pipeline
 OCR Output → Intent + NER → Matching → Structured JSON
 """
 
-from .full_pipeline import ReceiptPipeline
 from .database_loader import load_mock_database, load_sample_receipts
 
+
+def __getattr__(name):
+    # ReceiptPipeline pulls in torch/transformers; import it on first use so
+    # lightweight modules (database_loader, daemon client) stay fast to load
+    if name == "ReceiptPipeline":
+        from .full_pipeline import ReceiptPipeline
+        return ReceiptPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "ReceiptPipeline",
     "load_mock_database",
@@ -3,14 +3,16 @@ CLI for Full Pipeline
 """
 
 import argparse
-import json
+import logging
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.pipeline.full_pipeline import ReceiptPipeline
+from src.pipeline.database_loader import dumps_json, loads_json, read_json, write_json
+from src.pipeline.daemon import DEFAULT_SOCKET_PATH, send_request, serve
 
 
 def main():
@@ -36,6 +38,10 @@ Examples:
   
   # Run demo
   python src/pipeline/cli.py --demo
+  
+  # Keep models loaded in a daemon, then send receipts to it
+  python src/pipeline/cli.py --daemon --enable-matching
+  python src/pipeline/cli.py --connect --pdf data/halkbank.pdf
         '''
     )
     
@@ -60,6 +66,24 @@ Examples:
         action='store_true',
         help='Run demo with example data'
     )
+    input_group.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Load models once and serve requests on a Unix socket'
+    )
+    
+    # Daemon client options
+    parser.add_argument(
+        '--connect',
+        action='store_true',
+        help='Send the input to a running --daemon instead of loading models'
+    )
+    parser.add_argument(
+        '--socket',
+        type=str,
+        default=DEFAULT_SOCKET_PATH,
+        help=f'Daemon socket path (default: {DEFAULT_SOCKET_PATH})'
+    )
     
     # PDF-specific options
     parser.add_argument(
@@ -73,6 +97,18 @@ Examples:
         action='store_true',
         help='Use hybrid bank detection (text + logo) for PDF processing'
     )
+    parser.add_argument(
+        '--pdf-engine',
+        type=str,
+        choices=['pymupdf', 'pdfminer'],
+        default='pymupdf',
+        help='PDF text extractor (default: pymupdf, falls back to pdfminer)'
+    )
+    parser.add_argument(
+        '--reprocess',
+        action='store_true',
+        help='Process the PDF even if it was already processed into --output\'s directory'
+    )
     
     # Matching options
     parser.add_argument(
@@ -86,6 +122,15 @@ Examples:
         help='Path to mock database JSON (default: tests/mock-data.json)'
     )
     
+    parser.add_argument(
+        '--precision',
+        type=str,
+        choices=['fp32', 'int8', 'fp16', 'bf16'],
+        default='fp32',
+        help='NLP model precision (int8: quantized ONNX models on CPU, see src/nlp/v4/quantize_onnx.py; '
+             'fp16/bf16: half precision on a CUDA GPU, bf16 needs Ampere or newer)'
+    )
+    
     parser.add_argument(
         '--output', '-o',
         type=str,
@@ -98,22 +143,63 @@ Examples:
         help='Pretty print output'
     )
     
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Show pipeline progress (intent, entities, matching)'
+    )
+    
     args = parser.parse_args()
     
-    # Initialize pipeline
-    pipeline = ReceiptPipeline(
-        enable_matching=args.enable_matching,
-        mock_db_path=args.mock_db
+    # Progress is logged at INFO; without --verbose it is not even formatted
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(message)s'
     )
     
-    # Process
+    if args.daemon:
+        serve(args.socket, enable_matching=args.enable_matching, mock_db_path=args.mock_db, precision=args.precision)
+        return
+    
+    if args.connect:
+        if args.demo:
+            parser.error('--connect cannot be used with --demo')
+        
+        if args.pdf:
+            request = {
+                'pdf': os.path.abspath(args.pdf),
+                'bank': args.bank,
+                'use_logo_detection': args.use_logo_detection,
+                'engine': args.pdf_engine
+            }
+        elif args.stdin:
+            request = {'ocr': loads_json(sys.stdin.buffer.read())}
+        else:
+            request = {'ocr': read_json(args.ocr_json)}
+        
+        result = send_request(request, args.socket)
+        if args.output:
+            write_json(result, args.output)
+        _print_result(result, args)
+        return
+    
     if args.demo:
-        # Run demo
+        # Run demo (builds its own pipeline)
         from src.pipeline.full_pipeline import demo
         demo()
         return
     
-    elif args.pdf:
+    from src.pipeline.full_pipeline import ReceiptPipeline
+    
+    # Initialize pipeline
+    pipeline = ReceiptPipeline(
+        enable_matching=args.enable_matching,
+        mock_db_path=args.mock_db,
+        precision=args.precision
+    )
+    
+    # Process
+    if args.pdf:
         # Process PDF directly
         print("=" * 80)
         print("📄 PDF MODE - Direct OCR Integration")
@@ -122,14 +208,15 @@ Examples:
             pdf_path=args.pdf,
             bank=args.bank,
             output_path=args.output,
-            use_logo_detection=args.use_logo_detection
+            use_logo_detection=args.use_logo_detection,
+            engine=args.pdf_engine,
+            skip_processed=not args.reprocess
         )
     
     elif args.stdin:
         # Read from stdin
         print("📥 Reading OCR output from stdin...")
-        ocr_json = sys.stdin.read()
-        ocr_data = json.loads(ocr_json)
+        ocr_data = loads_json(sys.stdin.buffer.read())
         result = pipeline.process_ocr_output(ocr_data)
     
     else:
@@ -139,15 +226,19 @@ Examples:
             output_path=args.output
         )
     
-    # Output
+    _print_result(result, args)
+
+
+def _print_result(result, args):
+    """Print result to stdout unless it was written to --output"""
     if not args.output:
         if args.pretty:
             print("\n" + "="*70)
             print("📋 RESULT:")
             print("="*70)
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            print(dumps_json(result, indent=True))
         else:
-            print(json.dumps(result, ensure_ascii=False))
+            print(dumps_json(result))
 
 
 if __name__ == '__main__':
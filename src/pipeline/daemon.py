@@ -0,0 +1,182 @@
+"""
+Pipeline Daemon - Keep NLP models loaded across CLI invocations
+
+One ReceiptPipeline is built at startup and serves requests over a Unix
+domain socket. Messages are length-prefixed JSON (4-byte big-endian
+length + body):
+
+    request:  {"ocr": {...}}  or  {"pdf": "/abs/path.pdf", "bank": ..., ...}
+    response: pipeline output dict, or {"status": "error", "error": "..."}
+"""
+
+import os
+import socket
+import socketserver
+import stat
+import struct
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    from .database_loader import dumps_json, loads_json
+except ImportError:
+    from src.pipeline.database_loader import dumps_json, loads_json
+
+
+DEFAULT_SOCKET_PATH = "/tmp/receipt-pipeline.sock"
+
+_HEADER = struct.Struct(">I")
+
+
+def _read_message(rfile) -> Optional[Any]:
+    """Read one length-prefixed JSON message (None on EOF)"""
+    header = rfile.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    (length,) = _HEADER.unpack(header)
+    body = rfile.read(length)
+    if len(body) < length:
+        return None
+    return loads_json(body)
+
+
+def _encode_message(data: Any) -> bytes:
+    """Encode data as one length-prefixed JSON message"""
+    body = dumps_json(data).encode('utf-8')
+    return _HEADER.pack(len(body)) + body
+
+
+class _PipelineHandler(socketserver.StreamRequestHandler):
+    """Serve requests on one connection until the client closes it"""
+
+    def handle(self):
+        while True:
+            try:
+                request = _read_message(self.rfile)
+            except ValueError as e:
+                # Malformed JSON body; the frame was fully read, keep serving
+                self.wfile.write(_encode_message({'status': 'error', 'error': f'Invalid JSON request: {e}'}))
+                continue
+            if request is None:
+                return
+            self.wfile.write(_encode_message(self.server.dispatch(request)))
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """
+    Remove a socket file left over from a previous run (it blocks bind())
+    
+    Raises:
+        FileExistsError: The path exists and is not a socket
+        RuntimeError: A daemon is already listening on the socket
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{socket_path} exists and is not a socket")
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Nobody is listening: stale socket file
+            os.unlink(socket_path)
+            return
+    raise RuntimeError(f"A pipeline daemon is already listening on {socket_path}")
+
+
+class PipelineServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Unix socket server sharing one loaded ReceiptPipeline
+
+    Connections are handled on separate threads; pipeline calls are
+    serialized with a lock (the models are not shared safely otherwise).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, pipeline):
+        _remove_stale_socket(socket_path)
+        super().__init__(socket_path, _PipelineHandler)
+        self.socket_path = socket_path
+        self.pipeline = pipeline
+        self.lock = threading.Lock()
+
+    def dispatch(self, request: Dict) -> Dict:
+        """Run one request through the pipeline"""
+        try:
+            with self.lock:
+                if 'ocr' in request:
+                    return self.pipeline.process_ocr_output(request['ocr'])
+                if 'pdf' in request:
+                    return self.pipeline.process_from_file(
+                        pdf_path=request['pdf'],
+                        bank=request.get('bank'),
+                        use_logo_detection=request.get('use_logo_detection', False),
+                        engine=request.get('engine', 'pymupdf')
+                    )
+            return {'status': 'error', 'error': 'Request must contain "ocr" or "pdf"'}
+        except Exception as e:
+            return {'status': 'error', 'error': str(e)}
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def serve(socket_path: str = DEFAULT_SOCKET_PATH, enable_matching: bool = True, mock_db_path: Optional[str] = None, precision: str = "fp32"):
+    """
+    Load the pipeline once and serve requests until interrupted
+
+    Args:
+        socket_path: Unix socket path to listen on
+        enable_matching: Enable receipt matching with tenant database
+        mock_db_path: Path to mock database JSON
+        precision: NLP model precision (see ReceiptPipeline)
+    """
+    try:
+        from .full_pipeline import ReceiptPipeline
+    except ImportError:
+        from src.pipeline.full_pipeline import ReceiptPipeline
+
+    pipeline = ReceiptPipeline(enable_matching=enable_matching, mock_db_path=mock_db_path, precision=precision)
+
+    with PipelineServer(socket_path, pipeline) as server:
+        print(f"🟢 Pipeline daemon listening on {socket_path} (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n🛑 Pipeline daemon stopped")
+
+
+def send_request(request: Dict, socket_path: str = DEFAULT_SOCKET_PATH) -> Dict:
+    """
+    Send one request to a running daemon and wait for the response
+
+    Args:
+        request: {"ocr": {...}} or {"pdf": path, ...}
+        socket_path: Unix socket path of the daemon
+
+    Returns:
+        Pipeline output dict
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(_encode_message(request))
+        with sock.makefile('rb') as rfile:
+            response = _read_message(rfile)
+
+    if response is None:
+        raise ConnectionError(f"Pipeline daemon closed the connection: {socket_path}")
+    return response
+
+
+__all__ = [
+    "DEFAULT_SOCKET_PATH",
+    "PipelineServer",
+    "serve",
+    "send_request",
+]
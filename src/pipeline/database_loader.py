@@ -2,28 +2,83 @@
 Database Loader - Load mock data for matching
 """
 
-import json
+import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# JSON helpers (orjson if installed) and the mtime-keyed file cache are shared
+# with the matching CLI
+try:
+    from src.ocr.jsonio import (
+        ORJSON_AVAILABLE,
+        clear_json_cache,
+        dumps_json,
+        loads_json,
+        read_json,
+        read_json_cached,
+        write_json,
+    )
+except ImportError:
+    from ocr.jsonio import (
+        ORJSON_AVAILABLE,
+        clear_json_cache,
+        dumps_json,
+        loads_json,
+        read_json,
+        read_json_cached,
+        write_json,
+    )
+
+
+def _mock_data_path(mock_data_path) -> str:
+    """Absolute mock data path (default: tests/mock-data.json)"""
+    if mock_data_path is None:
+        # Default path
+        root_dir = Path(__file__).parent.parent.parent
+        mock_data_path = root_dir / "tests" / "mock-data.json"
+    return os.path.abspath(mock_data_path)
+
+
+def _load_mock_data(mock_data_path) -> Dict[str, Any]:
+    """
+    Load mock data JSON, reusing the parsed result while the file is unchanged
+    
+    The returned data is shared between callers and must not be mutated.
+    """
+    return read_json_cached(_mock_data_path(mock_data_path))
+
+
+def mock_database_key(mock_data_path: Optional[str] = None) -> str:
+    """
+    Identity of the mock database file: absolute path, mtime and size
+    
+    Changes whenever another file is used or the file is edited, so results
+    matched against an older database are not reused.
+    """
+    path_str = _mock_data_path(mock_data_path)
+    st = os.stat(path_str)
+    return f"{path_str}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def clear_cache() -> None:
+    """Drop all cached mock data."""
+    clear_json_cache()
+
 
 def load_mock_database(mock_data_path: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
     """
     Load mock database from JSON file
     
+    The file is parsed once per process while its modification time and
+    size are unchanged; repeated calls return the same record lists.
+    
     Args:
         mock_data_path: Path to mock data JSON (default: tests/mock-data.json)
     
     Returns:
         Dictionary with owners, customers, properties lists
     """
-    if mock_data_path is None:
-        # Default path
-        root_dir = Path(__file__).parent.parent.parent
-        mock_data_path = root_dir / "tests" / "mock-data.json"
-    
-    with open(mock_data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = _load_mock_data(mock_data_path)
     
     database_records = data.get("database_records", {})
     
@@ -44,17 +99,18 @@ def load_sample_receipts(mock_data_path: Optional[str] = None) -> List[Dict[str,
     Returns:
         List of sample receipts
     """
-    if mock_data_path is None:
-        root_dir = Path(__file__).parent.parent.parent
-        mock_data_path = root_dir / "tests" / "mock-data.json"
-    
-    with open(mock_data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = _load_mock_data(mock_data_path)
     
     return data.get("dekont_ornekleri", [])
 
 
 __all__ = [
     "load_mock_database",
-    "load_sample_receipts"
+    "load_sample_receipts",
+    "mock_database_key",
+    "read_json",
+    "loads_json",
+    "dumps_json",
+    "write_json",
+    "clear_cache",
 ]
@@ -16,29 +16,98 @@ Example OCR Input:
 }
 """
 
-import json
+import hashlib
+import importlib.util
+import io
+import logging
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.nlp.v4.inference_v4 import (
-    RobustIntentClassifier,
-    RobustNERExtractor
-)
 from src.ocr.extraction.extractor import extract_fields
 from src.ocr.extraction.bank_detector import detect_bank_hybrid, detect_bank
-from src.ocr.matching.matcher import match_receipt, ReceiptMatchResult
-from pdfminer.high_level import extract_text
+
+# Heavy dependencies (torch/transformers, PDF engines, matcher) are imported
+# where they are used, so the --ocr-json path never loads a PDF engine and
+# importing this module stays cheap. Availability is checked without importing.
+PYMUPDF_AVAILABLE = importlib.util.find_spec("fitz") is not None
+PDFMINER_AVAILABLE = importlib.util.find_spec("pdfminer") is not None
 
 # Import database loader
 try:
-    from .database_loader import load_mock_database
+    from .database_loader import load_mock_database, mock_database_key, read_json, write_json
+    from .processed_index import INDEX_FILENAME, ProcessedIndex, receipt_digest
 except ImportError:
-    from src.pipeline.database_loader import load_mock_database
+    from src.pipeline.database_loader import load_mock_database, mock_database_key, read_json, write_json
+    from src.pipeline.processed_index import INDEX_FILENAME, ProcessedIndex, receipt_digest
+
+
+# Progress output goes through logging: batch runs keep the default WARNING
+# level and skip message formatting (see cli.py --verbose)
+logger = logging.getLogger('receipt_pipeline')
+
+PDF_ENGINES = ("pymupdf", "pdfminer")
+
+
+def extract_pdf_text(pdf_path: str, engine: str = "pymupdf", data: Optional[bytes] = None) -> str:
+    """
+    Extract plain text from a PDF receipt
+    
+    PyMuPDF (C/MuPDF binding) is used by default; pdfminer.six is the
+    fallback when PyMuPDF is not installed or the file is encrypted.
+    
+    Args:
+        pdf_path: Path to PDF file
+        engine: "pymupdf" or "pdfminer"
+        data: PDF content already read by the caller (the file is not reopened)
+    
+    Returns:
+        Extracted text (pages joined with newlines)
+    """
+    if engine not in PDF_ENGINES:
+        raise ValueError(f"Unknown PDF engine: {engine} (expected one of {PDF_ENGINES})")
+    
+    if engine == "pymupdf" and PYMUPDF_AVAILABLE:
+        import fitz  # PyMuPDF
+        
+        with (fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(pdf_path)) as doc:
+            if not doc.needs_pass:
+                return "\n".join(page.get_text("text") for page in doc)
+        # Encrypted files fall through to pdfminer
+    
+    if not PDFMINER_AVAILABLE:
+        if engine == "pdfminer":
+            raise ImportError("pdfminer engine is not installed. Install with: pip install pdfminer.six")
+        if PYMUPDF_AVAILABLE:
+            raise ImportError("Encrypted PDFs are read with pdfminer. Install with: pip install pdfminer.six")
+        raise ImportError("No PDF text extractor available. Install with: pip install pymupdf")
+    from pdfminer.high_level import extract_text
+    
+    return extract_text(io.BytesIO(data) if data is not None else pdf_path)
+
+
+def _output_names(pdf_paths: List[str]) -> List[str]:
+    """
+    Output JSON file names for a batch of PDFs
+    
+    `<stem>.json`, or `<stem>-<8 hex of the path's SHA1>.json` for stems
+    shared by several inputs (e.g. same file name in different directories),
+    so outputs never overwrite each other. Names are stable across runs.
+    """
+    stems = [Path(pdf_path).stem for pdf_path in pdf_paths]
+    counts = Counter(stems)
+    return [
+        f"{stem}.json" if counts[stem] == 1
+        else f"{stem}-{hashlib.sha1(str(Path(pdf_path).resolve()).encode('utf-8')).hexdigest()[:8]}.json"
+        for stem, pdf_path in zip(stems, pdf_paths)
+    ]
 
 
 class ReceiptPipeline:
@@ -57,30 +126,76 @@ class ReceiptPipeline:
     - Informal keyword handling (kra, aydat)
     """
     
-    def __init__(self, enable_matching: bool = False, mock_db_path: Optional[str] = None):
-        print("🚀 Initializing Receipt Pipeline...")
-        print("   Loading NLP models...")
+    # (OCR key, NER key, output key) for fields both sources can provide
+    _MERGE_TABLE = (
+        ('sender', 'sender', 'sender'),
+        ('sender_iban', 'sender_iban', 'sender_iban'),
+        ('recipient', 'receiver', 'receiver'),
+        ('receiver_iban', 'receiver_iban', 'receiver_iban'),
+        ('amount', 'amount', 'amount'),
+        ('date', 'date', 'date'),
+    )
+    # V4: Added 'title' (property name), removed 'fee'
+    _NER_ONLY = ('apt_no', 'period', 'bank', 'transaction_type', 'title')
+    
+    # Summary line: intent display names and (entity, label) parts in order
+    _INTENT_NAMES = {
+        'kira_odemesi': 'Kira Ödemesi',
+        'aidat_odemesi': 'Aidat Ödemesi',
+        'kapora_odemesi': 'Kapora Ödemesi',
+        'depozito_odemesi': 'Depozito Ödemesi'
+    }
+    _SUMMARY_SPEC = (
+        ('sender', '👤 Gönderen'),
+        ('receiver', '👤 Alıcı'),
+        ('amount', '💰 Tutar'),
+        ('title', '🏢 Mülk'),
+        ('apt_no', '🏠 Daire'),
+        ('period', '📅 Dönem'),
+        ('date', '📆 Tarih'),
+    )
+    
+    def __init__(self, enable_matching: bool = False, mock_db_path: Optional[str] = None, precision: str = "fp32"):
+        logger.info("🚀 Initializing Receipt Pipeline...")
+        logger.info("   Loading NLP models (%s)...", precision)
+        
+        from src.nlp.v4.inference_v4 import RobustIntentClassifier, RobustNERExtractor
         
-        # Load NLP models
-        self.intent_classifier = RobustIntentClassifier()
-        self.ner_extractor = RobustNERExtractor()
+        # Load NLP models (precision: "fp32", "int8" ONNX Runtime on CPU,
+        # or "fp16"/"bf16" on a CUDA GPU)
+        self.intent_classifier = RobustIntentClassifier(precision=precision)
+        self.ner_extractor = RobustNERExtractor(precision=precision)
+        self.precision = precision
         
         # Load database for matching (optional)
         self.enable_matching = enable_matching
         self.database = None
+        self.matching_db = None
+        self.database_key = None
         
         if enable_matching:
-            print("   Loading mock database for matching...")
+            logger.info("   Loading mock database for matching...")
+            from src.ocr.matching.matcher import prepare_matching_db
+            
             try:
+                self.database_key = mock_database_key(mock_db_path)
                 self.database = load_mock_database(mock_db_path)
-                print(f"   ✅ Loaded {len(self.database['owners'])} owners, "
-                      f"{len(self.database['customers'])} customers, "
-                      f"{len(self.database['properties'])} properties")
+                self.matching_db = prepare_matching_db(
+                    self.database['owners'],
+                    self.database['customers'],
+                    self.database['properties']
+                )
+                logger.info(
+                    "   ✅ Loaded %d owners, %d customers, %d properties",
+                    len(self.database['owners']),
+                    len(self.database['customers']),
+                    len(self.database['properties'])
+                )
             except Exception as e:
-                print(f"   ⚠️  Failed to load database: {e}")
+                logger.warning("   ⚠️  Failed to load database: %s", e)
                 self.enable_matching = False
         
-        print("   ✅ Models loaded!")
+        logger.info("   ✅ Models loaded!")
     
     def process_ocr_output(self, ocr_result: Dict) -> Dict:
         """
@@ -96,72 +211,169 @@ class ReceiptPipeline:
         description = ocr_result.get('description', '')
         
         if not description:
-            return {
-                'status': 'error',
-                'error': 'No description found in OCR output',
-                'ocr_data': ocr_result
-            }
+            return self._missing_description(ocr_result)
         
-        print(f"\n📝 Processing description:")
-        print(f"   {description[:80]}...")
+        logger.info("\n📝 Processing description:\n   %.80s...", description)
         
         # 1. Intent Classification
-        print(f"\n🎯 Running Intent Classification...")
+        logger.info("\n🎯 Running Intent Classification...")
         intent_result = self.intent_classifier.predict(
             description, 
             multi_intent=True
         )
         
-        print(f"   Primary Intent: {intent_result['primary_intent']}")
-        print(f"   Confidence: {intent_result['confidence']:.2%}")
-        
-        if intent_result['is_multi_intent']:
-            print(f"   🔥 Multi-Intent Detected: {intent_result['detected_intents']}")
-        
         # 2. NER Extraction
-        print(f"\n🏷️  Running NER Extraction (Hybrid)...")
+        logger.info("\n🏷️  Running NER Extraction (Hybrid)...")
         ner_result = self.ner_extractor.extract(
             description, 
             use_fallback=True
         )
         
-        print(f"   Extracted Entities:")
-        confidence_scores = ner_result.get('confidence_scores', {})
-        for entity_type, value in ner_result['entities_merged'].items():
-            method = ner_result['extraction_method'].get(entity_type, 'unknown')
-            confidence = confidence_scores.get(entity_type, 0.0)
-            print(f"      {entity_type:15s}: {value} [{method}] (conf: {confidence:.2%})")
+        # 3. Receipt Matching (if enabled)
+        matching_result = self._match_receipt(ocr_result) if self._matching_ready() else None
+        
+        return self._build_output(ocr_result, intent_result, ner_result, matching_result=matching_result)
+    
+    def process_ocr_batch(self, ocr_results: List[Dict]) -> List[Dict]:
+        """
+        Process many OCR outputs, running intent and NER models batched
+        
+        Args:
+            ocr_results: OCR extraction results (JSON)
+        
+        Returns:
+            Structured outputs, in input order (same as `process_ocr_output`)
+        """
+        descriptions = [ocr_result.get('description', '') for ocr_result in ocr_results]
+        texts = [description for description in descriptions if description]
+        
+        logger.info("\n🎯 Running Intent Classification + NER on %d descriptions (batched)...", len(texts))
+        intent_results = iter(self.intent_classifier.predict_batch(texts, multi_intent=True))
+        ner_results = iter(self.ner_extractor.extract_batch(texts, use_fallback=True))
+        
+        # Receipt matching for the whole batch (name similarity matrices at once)
+        matching_results = iter([None] * len(texts))
+        if self._matching_ready():
+            matching_results = iter(self._match_receipts([
+                ocr_result for ocr_result, description in zip(ocr_results, descriptions) if description
+            ]))
+        
+        # One timestamp for the whole batch
+        timestamp = datetime.now().isoformat()
+        
+        outputs = []
+        for ocr_result, description in zip(ocr_results, descriptions):
+            if not description:
+                outputs.append(self._missing_description(ocr_result))
+                continue
+            
+            logger.info("\n📝 Description: %.80s...", description)
+            outputs.append(self._build_output(
+                ocr_result, next(intent_results), next(ner_results), timestamp, next(matching_results)
+            ))
+        
+        return outputs
+    
+    def _missing_description(self, ocr_result: Dict) -> Dict:
+        """Error output for OCR results without a description"""
+        return {
+            'status': 'error',
+            'error': 'No description found in OCR output',
+            'ocr_data': ocr_result
+        }
+    
+    def _matching_ready(self) -> bool:
+        """Matching is enabled and its database loaded"""
+        return bool(self.enable_matching and self.database)
+    
+    def _match_receipt(self, ocr_result: Dict):
+        """Match one receipt against the database (None if matching fails)"""
+        from src.ocr.matching.matcher import match_receipt
+        
+        logger.info("\n🔗 Running Receipt Matching...")
+        try:
+            matching_result = match_receipt(
+                ocr_data=ocr_result,
+                owners=self.database['owners'],
+                customers=self.database['customers'],
+                properties=self.database['properties'],
+                min_confidence=70.0,
+                **self.matching_db
+            )
+        except Exception as e:
+            logger.warning("   ⚠️  Matching failed: %s", e)
+            return None
+        
+        self._log_match(matching_result)
+        return matching_result
+    
+    def _match_receipts(self, ocr_results: List[Dict]) -> List:
+        """
+        Match many receipts with one `match_receipts` call
+        
+        If the batch call fails, receipts are matched one by one so a single
+        bad receipt only loses its own matching result.
+        """
+        from src.ocr.matching.matcher import match_receipts
+        
+        logger.info("\n🔗 Running Receipt Matching on %d receipts (batched)...", len(ocr_results))
+        try:
+            matching_results = match_receipts(
+                ocr_results,
+                owners=self.database['owners'],
+                customers=self.database['customers'],
+                properties=self.database['properties'],
+                min_confidence=70.0,
+                **self.matching_db
+            )
+        except Exception as e:
+            logger.warning("   ⚠️  Batch matching failed, matching one by one: %s", e)
+            return [self._match_receipt(ocr_result) for ocr_result in ocr_results]
+        
+        for matching_result in matching_results:
+            self._log_match(matching_result)
+        return matching_results
+    
+    def _log_match(self, matching_result) -> None:
+        """Log the outcome of one receipt match"""
+        logger.info("   Match Status: %s", matching_result.match_status)
+        logger.info("   Confidence: %.1f%%", matching_result.confidence_score)
+        if matching_result.owner_id:
+            logger.info("   Matched Owner ID: %s", matching_result.owner_id)
+            logger.info("   Property ID: %s", matching_result.property_id)
+            logger.info("   Customer ID: %s", matching_result.customer_id)
+    
+    def _build_output(self, ocr_result: Dict, intent_result: Dict, ner_result: Dict, timestamp: Optional[str] = None, matching_result=None) -> Dict:
+        """
+        Merge model results with OCR data and build the output
+        
+        Args:
+            timestamp: ISO timestamp shared by a batch (default: now)
+            matching_result: ReceiptMatchResult for the receipt (None if
+                matching is disabled or failed)
+        """
+        # Per-entity formatting is skipped entirely when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("   Primary Intent: %s", intent_result['primary_intent'])
+            logger.info("   Confidence: %.2f%%", intent_result['confidence'] * 100)
+            
+            if intent_result['is_multi_intent']:
+                logger.info("   🔥 Multi-Intent Detected: %s", intent_result['detected_intents'])
+            
+            logger.info("   Extracted Entities:")
+            confidence_scores = ner_result.get('confidence_scores', {})
+            for entity_type, value in ner_result['entities_merged'].items():
+                method = ner_result['extraction_method'].get(entity_type, 'unknown')
+                confidence = confidence_scores.get(entity_type, 0.0)
+                logger.info("      %-15s: %s [%s] (conf: %.2f%%)", entity_type, value, method, confidence * 100)
         
         # 3. Merge with OCR data
         merged_entities = self._merge_entities(ocr_result, ner_result['entities_merged'])
         
-        # 4. Receipt Matching (if enabled)
-        matching_result = None
-        if self.enable_matching and self.database:
-            print(f"\n🔗 Running Receipt Matching...")
-            try:
-                matching_result = match_receipt(
-                    ocr_data=ocr_result,
-                    owners=self.database['owners'],
-                    customers=self.database['customers'],
-                    properties=self.database['properties'],
-                    min_confidence=70.0
-                )
-                
-                print(f"   Match Status: {matching_result.match_status}")
-                print(f"   Confidence: {matching_result.confidence_score:.1f}%")
-                if matching_result.owner_id:
-                    print(f"   Matched Owner ID: {matching_result.owner_id}")
-                    print(f"   Property ID: {matching_result.property_id}")
-                    print(f"   Customer ID: {matching_result.customer_id}")
-                
-            except Exception as e:
-                print(f"   ⚠️  Matching failed: {e}")
-        
-        # 5. Build structured output
+        # 4. Build structured output
         output = {
             'status': 'success',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp or datetime.now().isoformat(),
             
             # OCR Data (original)
             'ocr_data': ocr_result,
@@ -229,42 +441,20 @@ class ReceiptPipeline:
         """
         merged = {}
         
-        # From OCR (high confidence)
-        if ocr_data.get('sender'):
-            merged['sender'] = ocr_data['sender']
-        elif 'sender' in ner_entities:
-            merged['sender'] = ner_entities['sender']
-        
-        if ocr_data.get('sender_iban'):
-            merged['sender_iban'] = ocr_data['sender_iban']
-        elif 'sender_iban' in ner_entities:
-            merged['sender_iban'] = ner_entities['sender_iban']
-        
-        if ocr_data.get('recipient'):
-            merged['receiver'] = ocr_data['recipient']
-        elif 'receiver' in ner_entities:
-            merged['receiver'] = ner_entities['receiver']
-        
-        if ocr_data.get('receiver_iban'):
-            merged['receiver_iban'] = ocr_data['receiver_iban']
-        elif 'receiver_iban' in ner_entities:
-            merged['receiver_iban'] = ner_entities['receiver_iban']
+        # From OCR (high confidence), NER as fallback
+        for ocr_key, ner_key, out_key in self._MERGE_TABLE:
+            value = ocr_data.get(ocr_key)
+            if value:
+                merged[out_key] = value
+            elif ner_key in ner_entities:
+                merged[out_key] = ner_entities[ner_key]
         
+        # Currency only accompanies an OCR amount
         if ocr_data.get('amount'):
-            merged['amount'] = ocr_data['amount']
             merged['amount_currency'] = ocr_data.get('amount_currency', 'TRY')
-        elif 'amount' in ner_entities:
-            merged['amount'] = ner_entities['amount']
-        
-        if ocr_data.get('date'):
-            merged['date'] = ocr_data['date']
-        elif 'date' in ner_entities:
-            merged['date'] = ner_entities['date']
         
         # From NER only (not in OCR)
-        # V4: Added 'title' (property name), removed 'fee'
-        ner_only_fields = ['apt_no', 'period', 'bank', 'transaction_type', 'title']
-        for field in ner_only_fields:
+        for field in self._NER_ONLY:
             if field in ner_entities:
                 merged[field] = ner_entities[field]
         
@@ -276,43 +466,21 @@ class ReceiptPipeline:
         """
         intent = intent_result['primary_intent']
         
-        intent_names = {
-            'kira_odemesi': 'Kira Ödemesi',
-            'aidat_odemesi': 'Aidat Ödemesi',
-            'kapora_odemesi': 'Kapora Ödemesi',
-            'depozito_odemesi': 'Depozito Ödemesi'
-        }
+        summary_parts = [f"📋 {self._INTENT_NAMES.get(intent, intent.upper())}"]
         
-        summary_parts = [f"📋 {intent_names.get(intent, intent.upper())}"]
-        
-        if entities.get('sender'):
-            summary_parts.append(f"👤 Gönderen: {entities['sender']}")
-        
-        if entities.get('receiver'):
-            summary_parts.append(f"👤 Alıcı: {entities['receiver']}")
-        
-        if entities.get('amount'):
-            currency = entities.get('amount_currency', 'TRY')
-            summary_parts.append(f"💰 Tutar: {entities['amount']} {currency}")
-        
-        if entities.get('title'):
-            summary_parts.append(f"🏢 Mülk: {entities['title']}")
-        
-        if entities.get('apt_no'):
-            summary_parts.append(f"🏠 Daire: {entities['apt_no']}")
-        
-        if entities.get('period'):
-            summary_parts.append(f"📅 Dönem: {entities['period']}")
-        
-        if entities.get('date'):
-            summary_parts.append(f"📆 Tarih: {entities['date']}")
+        for key, label in self._SUMMARY_SPEC:
+            value = entities.get(key)
+            if value:
+                if key == 'amount':
+                    value = f"{value} {entities.get('amount_currency', 'TRY')}"
+                summary_parts.append(f"{label}: {value}")
         
         if intent_result['is_multi_intent']:
             summary_parts.append(f"🔥 Karışık Ödeme: {', '.join(intent_result['detected_intents'])}")
         
         return " | ".join(summary_parts)
     
-    def process_from_file(self, pdf_path: str, bank: str = None, output_path: Optional[str] = None, use_logo_detection: bool = False) -> Dict:
+    def process_from_file(self, pdf_path: str, bank: str = None, output_path: Optional[str] = None, use_logo_detection: bool = False, engine: str = "pymupdf", skip_processed: bool = True) -> Dict:
         """
         Full pipeline from PDF file
         
@@ -321,69 +489,225 @@ class ReceiptPipeline:
             bank: Bank name hint (halkbank, kuveytturk, yapikredi, ziraatbank). If None, auto-detect.
             output_path: Optional output JSON path
             use_logo_detection: Use hybrid bank detection (text + logo)
+            engine: PDF text extractor ("pymupdf" or "pdfminer")
+            skip_processed: With output_path, return the saved result if the
+                same PDF was already processed with the same options
+                (tracked in .receipt_index.sqlite next to the output)
         
         Returns:
             Structured output
         """
-        print(f"📄 Processing receipt: {pdf_path}")
+        logger.info("📄 Processing receipt: %s", pdf_path)
+        
+        # One read of the file serves both the digest and the PDF parser
+        data = Path(pdf_path).read_bytes()
+        
+        index = None
+        if output_path and skip_processed:
+            index = ProcessedIndex(Path(output_path).resolve().parent / INDEX_FILENAME)
+            digest = receipt_digest(pdf_path, self._options_key(bank, use_logo_detection, engine), data=data)
+            processed_path = index.lookup(digest, Path(output_path).resolve())
+            if processed_path:
+                logger.info("   ⏭️  Already processed, reusing: %s", processed_path)
+                result = read_json(processed_path)
+                if Path(processed_path) != Path(output_path).resolve():
+                    write_json(result, output_path)
+                    index.record(digest, Path(output_path).resolve())
+                return result
         
-        # 1. OCR Extraction
-        print(f"\n🔍 Step 1/3: OCR Text Extraction...")
         try:
-            # Extract text from PDF
-            text = extract_text(pdf_path)
-            
-            if not text or not text.strip():
-                raise ValueError("PDF'den metin çıkarılamadı. Dosya boş veya okunamaz olabilir.")
-            
-            print(f"   ✅ Text extracted ({len(text)} characters)")
-            
-            # Auto-detect bank if not provided
-            if not bank:
-                print(f"\n🔍 Auto-detecting bank...")
-                if use_logo_detection:
-                    bank = detect_bank_hybrid(text, pdf_path=pdf_path)
-                    print(f"   ℹ️  Method: Hybrid (text + logo)")
-                else:
-                    bank = detect_bank(text)
-                    print(f"   ℹ️  Method: Text-based")
-                
-                if bank:
-                    print(f"   ✅ Detected bank: {bank}")
-                else:
-                    print(f"   ⚠️  Bank could not be detected, using generic patterns")
-            else:
-                print(f"🏦 Bank (provided): {bank}")
-            
-            # Extract structured fields using regex patterns
-            print(f"\n🔍 Step 2/3: Field Extraction...")
-            ocr_result = extract_fields(text, bank_hint=bank)
-            
-            if not ocr_result:
-                raise ValueError("OCR'dan hiçbir alan çıkarılamadı.")
-            
-            print(f"   ✅ Extracted {len(ocr_result)} fields")
-            for field, value in ocr_result.items():
-                if value:
-                    print(f"      • {field}: {value[:50]}..." if len(str(value)) > 50 else f"      • {field}: {value}")
-            
+            ocr_result = self._extract_ocr(pdf_path, bank, use_logo_detection, engine, data=data)
         except Exception as e:
-            print(f"\n❌ OCR Extraction failed: {e}")
+            logger.error("\n❌ OCR Extraction failed: %s", e)
             raise
         
         # 2. NLP Processing (Intent + NER)
-        print(f"\n🔍 Step 3/3: NLP Processing...")
+        logger.info("\n🔍 Step 3/3: NLP Processing...")
         result = self.process_ocr_output(ocr_result)
         
         # 3. Save output
         if output_path:
-            print(f"\n💾 Saving to: {output_path}")
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
-            print(f"   ✅ Saved successfully")
+            logger.info("\n💾 Saving to: %s", output_path)
+            write_json(result, output_path)
+            if index is not None:
+                index.record(digest, Path(output_path).resolve())
+            logger.info("   ✅ Saved successfully")
         
         return result
     
+    def _options_key(self, bank: Optional[str], use_logo_detection: bool, engine: str) -> str:
+        """Processing options that change the result of a PDF (for the processed index)"""
+        # Matching results depend on which database (path, mtime, size) was loaded
+        database_key = self.database_key if self.enable_matching else None
+        return f"{bank}|{use_logo_detection}|{engine}|{self.precision}|{database_key}"
+    
+    def _extract_ocr(self, pdf_path: str, bank: Optional[str] = None, use_logo_detection: bool = False, engine: str = "pymupdf", data: Optional[bytes] = None) -> Dict:
+        """
+        PDF text extraction, bank detection and regex field extraction
+        
+        Returns:
+            OCR result (extract_fields output)
+        """
+        # 1. OCR Extraction
+        logger.info("\n🔍 Step 1/3: OCR Text Extraction...")
+        # Extract text from PDF
+        text = extract_pdf_text(pdf_path, engine=engine, data=data)
+        
+        if not text or not text.strip():
+            raise ValueError("PDF'den metin çıkarılamadı. Dosya boş veya okunamaz olabilir.")
+        
+        logger.info("   ✅ Text extracted (%d characters)", len(text))
+        
+        # Auto-detect bank if not provided
+        if not bank:
+            logger.info("\n🔍 Auto-detecting bank...")
+            if use_logo_detection:
+                bank = detect_bank_hybrid(text, pdf_path=pdf_path)
+                logger.info("   ℹ️  Method: Hybrid (text + logo)")
+            else:
+                bank = detect_bank(text)
+                logger.info("   ℹ️  Method: Text-based")
+            
+            if bank:
+                logger.info("   ✅ Detected bank: %s", bank)
+            else:
+                logger.warning("   ⚠️  Bank could not be detected, using generic patterns")
+        else:
+            logger.info("🏦 Bank (provided): %s", bank)
+        
+        # Extract structured fields using regex patterns
+        logger.info("\n🔍 Step 2/3: Field Extraction...")
+        ocr_result = extract_fields(text, bank_hint=bank)
+        
+        if not ocr_result:
+            raise ValueError("OCR'dan hiçbir alan çıkarılamadı.")
+        
+        logger.info("   ✅ Extracted %d fields", len(ocr_result))
+        if logger.isEnabledFor(logging.INFO):
+            for field, value in ocr_result.items():
+                if value:
+                    if len(str(value)) > 50:
+                        logger.info("      • %s: %s...", field, value[:50])
+                    else:
+                        logger.info("      • %s: %s", field, value)
+        
+        return ocr_result
+    
+    def process_from_files(
+        self,
+        pdf_paths: List[str],
+        bank: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        use_logo_detection: bool = False,
+        engine: str = "pymupdf",
+        batch_size: int = 16,
+        extract_workers: Optional[int] = None,
+        skip_processed: bool = True
+    ) -> List[Dict]:
+        """
+        Full pipeline for many PDF files, overlapping extraction with NLP
+        
+        PDFs are extracted on a thread pool while the NLP models run on
+        batches of `batch_size` already-extracted receipts; outputs are
+        written on a separate writer thread.
+        
+        Args:
+            pdf_paths: Paths to PDF receipts
+            bank: Bank name hint for all files. If None, auto-detect per file.
+            output_dir: Optional directory for `<pdf stem>.json` outputs
+                (`<pdf stem>-<path hash>.json` when several inputs share a stem)
+            use_logo_detection: Use hybrid bank detection (text + logo)
+            engine: PDF text extractor ("pymupdf" or "pdfminer")
+            batch_size: Receipts per NLP batch
+            extract_workers: Extraction threads. Defaults to 1 for PyMuPDF
+                (not safe to use from several threads at once) and to the
+                CPU count for pdfminer.
+            skip_processed: With output_dir, reuse results of PDFs already
+                processed with the same options (see `process_from_file`)
+        
+        Returns:
+            Structured outputs, in input order. Files that fail extraction
+            get {'status': 'error', 'error': ..., 'pdf_path': ...}.
+        """
+        results: List[Optional[Dict]] = [None] * len(pdf_paths)
+        digests: Dict[int, str] = {}
+        
+        index = None
+        output_names = []
+        if output_dir:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            output_names = _output_names(pdf_paths)
+            if skip_processed:
+                index = ProcessedIndex(Path(output_dir).resolve() / INDEX_FILENAME)
+        options = self._options_key(bank, use_logo_detection, engine)
+        
+        if extract_workers is None:
+            extract_workers = 1 if engine == "pymupdf" else (os.cpu_count() or 1)
+        
+        def output_path(i: int) -> Path:
+            return (Path(output_dir) / output_names[i]).resolve()
+        
+        def extract(i: int):
+            """(result, reused_path): a saved result and its path, or the OCR result to process"""
+            # One read of the file serves both the digest and the PDF parser
+            data = Path(pdf_paths[i]).read_bytes()
+            if index is not None:
+                digests[i] = receipt_digest(pdf_paths[i], options, data=data)
+                processed_path = index.lookup(digests[i], output_path(i))
+                if processed_path:
+                    return read_json(processed_path), processed_path
+            return self._extract_ocr(pdf_paths[i], bank, use_logo_detection, engine, data=data), None
+        
+        def save(i: int, result: Dict):
+            write_json(result, output_path(i))
+            if index is not None:
+                index.record(digests[i], output_path(i))
+        
+        reused = 0
+        with ThreadPoolExecutor(max_workers=extract_workers) as extract_pool, \
+                ThreadPoolExecutor(max_workers=1) as write_pool:
+            futures = {extract_pool.submit(extract, i): i for i in range(len(pdf_paths))}
+            writes = []
+            batch = []
+            
+            def flush():
+                outputs = self.process_ocr_batch([ocr_result for _, ocr_result in batch])
+                for (i, _), output in zip(batch, outputs):
+                    results[i] = output
+                    if output_dir:
+                        writes.append(write_pool.submit(save, i, output))
+                batch.clear()
+            
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    result, reused_path = future.result()
+                except Exception as e:
+                    logger.error("\n❌ OCR Extraction failed (%s): %s", pdf_paths[i], e)
+                    results[i] = {'status': 'error', 'error': str(e), 'pdf_path': str(pdf_paths[i])}
+                else:
+                    if reused_path:
+                        results[i] = result
+                        reused += 1
+                        # Same content saved under another name (or an earlier stem)
+                        if Path(reused_path) != output_path(i):
+                            writes.append(write_pool.submit(save, i, result))
+                    else:
+                        batch.append((i, result))
+                if len(batch) >= batch_size:
+                    flush()
+            if batch:
+                flush()
+            
+            # Surface write errors
+            for write in writes:
+                write.result()
+        
+        if index is not None:
+            logger.info("⏭️  %d of %d PDFs already processed", reused, len(pdf_paths))
+        
+        return results
+    
     def process_from_ocr_json(self, ocr_json_path: str, output_path: Optional[str] = None) -> Dict:
         """
         Process from OCR JSON output file
@@ -395,20 +719,18 @@ class ReceiptPipeline:
         Returns:
             Structured output
         """
-        print(f"📂 Loading OCR output: {ocr_json_path}")
+        logger.info("📂 Loading OCR output: %s", ocr_json_path)
         
-        with open(ocr_json_path, 'r', encoding='utf-8') as f:
-            ocr_result = json.load(f)
+        ocr_result = read_json(ocr_json_path)
         
         # Process
         result = self.process_ocr_output(ocr_result)
         
         # Save if output path provided
         if output_path:
-            print(f"\n💾 Saving result to: {output_path}")
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            print(f"   ✅ Saved!")
+            logger.info("\n💾 Saving result to: %s", output_path)
+            write_json(result, output_path)
+            logger.info("   ✅ Saved!")
         
         return result
 
@@ -416,6 +738,10 @@ class ReceiptPipeline:
 def demo():
     """Demo with example OCR output"""
     
+    # The demo shows the pipeline's progress output
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
+    
     print("╔═══════════════════════════════════════════════════════════╗")
     print("║     🚀 FULL RECEIPT PROCESSING PIPELINE - DEMO           ║")
     print("╚═══════════════════════════════════════════════════════════╝")
@@ -466,14 +792,14 @@ def demo():
     # Initialize pipeline
     pipeline = ReceiptPipeline()
     
-    # Process each test case
-    for i, test_case in enumerate(test_cases, 1):
+    # Process all test cases in one batch
+    results = pipeline.process_ocr_batch([test_case['ocr_output'] for test_case in test_cases])
+    
+    for i, (test_case, result) in enumerate(zip(test_cases, results), 1):
         print(f"\n{'='*70}")
         print(f"[TEST {i}] {test_case['name']}")
         print(f"{'='*70}")
         
-        result = pipeline.process_ocr_output(test_case['ocr_output'])
-        
         if result['status'] == 'success':
             print(f"\n✅ PROCESSING SUCCESSFUL")
             print(f"\n📋 SUMMARY:")
@@ -0,0 +1,133 @@
+"""
+Processed Receipt Index - Skip PDFs that were already processed
+
+Maps a SHA1 digest of the PDF content (plus processing options) to the
+JSON result written for it, in a small SQLite database next to the
+outputs. WAL mode lets concurrent batch workers share one index.
+
+The result file's size and mtime are recorded with it; a result that was
+overwritten since (by another receipt or by hand) is not reused. A digest
+may have several result files (copies written for other output paths).
+"""
+
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+
+INDEX_FILENAME = ".receipt_index.sqlite"
+
+# Bumped when the table layout changes; older indexes are rebuilt
+SCHEMA_VERSION = 2
+
+
+def receipt_digest(pdf_path, options: str = "", data: Optional[bytes] = None) -> str:
+    """
+    SHA1 hex digest of a PDF file, salted with processing options
+
+    Args:
+        pdf_path: Path to PDF file
+        options: Options that change the result (bank hint, engine, ...)
+        data: PDF content already read by the caller (the file is not reopened)
+
+    Returns:
+        40-character hex digest
+    """
+    if data is not None:
+        digest = hashlib.sha1(data)
+    else:
+        with open(pdf_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                digest = hashlib.file_digest(f, 'sha1')
+            else:
+                digest = hashlib.sha1()
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+    # Same PDF processed with different options is a different entry
+    digest.update(options.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ProcessedIndex:
+    """
+    SQLite table of processed receipts: sha1 -> result JSON paths
+    """
+
+    def __init__(self, index_path):
+        self.index_path = Path(index_path)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                # The index is only a cache; entries in an older layout are dropped
+                conn.execute("DROP TABLE IF EXISTS processed")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS processed ("
+                "sha1 TEXT NOT NULL, result_path TEXT NOT NULL, "
+                "result_mtime_ns INTEGER NOT NULL, result_size INTEGER NOT NULL, "
+                "ts INTEGER NOT NULL, PRIMARY KEY (sha1, result_path))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS processed_result_path ON processed (result_path)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.index_path, timeout=30)
+
+    def lookup(self, sha1: str, preferred_path=None) -> Optional[str]:
+        """
+        Result path recorded for a digest
+
+        Args:
+            sha1: Digest from `receipt_digest`
+            preferred_path: Return this path if it holds the result
+
+        Returns:
+            A path whose file is unchanged since it was recorded, or None if
+            never processed or if every recorded file is gone or modified
+        """
+        preferred_path = str(preferred_path) if preferred_path else ""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT result_path, result_mtime_ns, result_size FROM processed "
+                "WHERE sha1 = ? ORDER BY result_path = ? DESC, ts DESC",
+                (sha1, preferred_path)
+            ).fetchall()
+        for result_path, mtime_ns, size in rows:
+            try:
+                stat = Path(result_path).stat()
+            except OSError:
+                continue
+            if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+                return result_path
+        return None
+
+    def record(self, sha1: str, result_path) -> None:
+        """
+        Record the result file just written for a digest
+
+        Other digests recorded for the same path are dropped: the file now
+        holds this receipt's result.
+        """
+        result_path = str(result_path)
+        stat = Path(result_path).stat()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM processed WHERE result_path = ? AND sha1 != ?",
+                (result_path, sha1)
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO processed "
+                "(sha1, result_path, result_mtime_ns, result_size, ts) VALUES (?, ?, ?, ?, ?)",
+                (sha1, result_path, stat.st_mtime_ns, stat.st_size, int(time.time()))
+            )
+
+
+__all__ = [
+    "INDEX_FILENAME",
+    "ProcessedIndex",
+    "receipt_digest",
+]